@@ -1,7 +1,8 @@
 """GitLab API client with authentication and request handling."""
 
+import asyncio
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import httpx
@@ -9,6 +10,14 @@ from pydantic import BaseModel
 
 from .utils import wrap_response
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "mcp-extended-gitlab[fast]"
+    orjson = None
+
+# Requests a single fan-out (page fetches, batch tool calls) keeps in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class GitLabConfig(BaseModel):
     """GitLab configuration model."""
@@ -16,6 +25,10 @@ class GitLabConfig(BaseModel):
     base_url: str = "https://gitlab.com/api/v4"
     private_token: Optional[str] = None
     timeout: int = 30
+    http2: bool = False  # Requires the h2 package: pip install "httpx[http2]"
+    max_connections: int = 100
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 60.0
     
 
 class GitLabClient:
@@ -44,7 +57,13 @@ class GitLabClient:
         self.client = httpx.AsyncClient(
             base_url=self.config.base_url,
             headers=self.headers,
-            timeout=self.config.timeout
+            timeout=self.config.timeout,
+            http2=self.config.http2,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            )
         )
 
     def _build_url(self, endpoint: str) -> str:
@@ -62,6 +81,13 @@ class GitLabClient:
         """Async context manager exit."""
         await self.client.aclose()
     
+    @staticmethod
+    def _json_body(json_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Request kwargs for a JSON body, encoded with orjson when installed."""
+        if json_data is None or orjson is None:
+            return {"json": json_data}
+        return {"content": orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)}
+    
     async def _handle_response(self, response: httpx.Response) -> Any:
         """Return JSON data when available, {} for 204, else text payload."""
         response.raise_for_status()
@@ -75,9 +101,75 @@ class GitLabClient:
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request."""
         url = self._build_url(endpoint)
-        response = await self.client.get(url, params=params)
+        response = await self.client.get(url, params=params or None)
         return await self._handle_response(response)
     
+    async def _get_page(self, url: str, params: Dict[str, Any]) -> Tuple[List[Any], httpx.Headers]:
+        """GET one page of a list endpoint, returning its items and response headers."""
+        response = await self.client.get(url, params=params)
+        body = await self._handle_response(response)
+        return (body if isinstance(body, list) else [body]), response.headers
+
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+        concurrency: int = MAX_CONCURRENT_REQUESTS,
+        max_pages: int = 10
+    ) -> Dict[str, Any]:
+        """Fetch the pages of a paginated GET endpoint, up to max_pages of them.
+
+        The first page is read to learn X-Total-Pages; the remaining pages are
+        then fetched concurrently (at most `concurrency` at a time). GitLab
+        omits X-Total-Pages for very large collections, in which case pages
+        are followed sequentially via X-Next-Page.
+
+        Returns the items with their count, the total number of pages (None
+        when GitLab did not report it), whether max_pages cut the listing
+        short, and the page to continue from in that case.
+        """
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        url = self._build_url(endpoint)
+        base_params = {**(params or {}), "per_page": per_page}
+
+        items, headers = await self._get_page(url, {**base_params, "page": 1})
+
+        total_pages = headers.get("x-total-pages")
+        if total_pages:
+            total_pages = int(total_pages)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(page: int) -> List[Any]:
+                async with semaphore:
+                    page_items, _ = await self._get_page(url, {**base_params, "page": page})
+                    return page_items
+
+            last_page = min(total_pages, max_pages)
+            pages = await asyncio.gather(*(fetch(p) for p in range(2, last_page + 1)))
+            for page_items in pages:
+                items.extend(page_items)
+            next_page = last_page + 1 if last_page < total_pages else None
+        else:
+            total_pages = None
+            next_page = headers.get("x-next-page")
+            fetched = 1
+            while next_page and fetched < max_pages:
+                page_items, headers = await self._get_page(url, {**base_params, "page": int(next_page)})
+                items.extend(page_items)
+                next_page = headers.get("x-next-page")
+                fetched += 1
+            next_page = int(next_page) if next_page else None
+
+        return {
+            "items": items,
+            "count": len(items),
+            "total_pages": total_pages,
+            "truncated": next_page is not None,
+            "next_page": next_page
+        }
+    
     async def post(
         self, 
         endpoint: str, 
@@ -87,7 +179,7 @@ class GitLabClient:
     ) -> Dict[str, Any]:
         """Make a POST request."""
         url = self._build_url(endpoint)
-        response = await self.client.post(url, json=json_data, data=data, files=files)
+        response = await self.client.post(url, data=data, files=files, **self._json_body(json_data))
         return await self._handle_response(response)
     
     async def put(
@@ -98,19 +190,19 @@ class GitLabClient:
     ) -> Dict[str, Any]:
         """Make a PUT request."""
         url = self._build_url(endpoint)
-        response = await self.client.put(url, json=json_data, data=data)
+        response = await self.client.put(url, data=data, **self._json_body(json_data))
         return await self._handle_response(response)
     
     async def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a DELETE request."""
         url = self._build_url(endpoint)
-        response = await self.client.delete(url, params=params)
+        response = await self.client.delete(url, params=params or None)
         return await self._handle_response(response)
     
     async def head(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a HEAD request."""
         url = self._build_url(endpoint)
-        response = await self.client.head(url, params=params)
+        response = await self.client.head(url, params=params or None)
         return await self._handle_response(response)
 
     async def close(self) -> None:
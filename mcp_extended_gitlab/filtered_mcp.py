@@ -314,7 +314,7 @@ class FilteredMCP:
             
             # List enabled presets if any match
             for preset_name, preset_tools in TOOL_PRESETS.items():
-                if self.enabled_tools == set(preset_tools):
+                if self.enabled_tools == preset_tools:
                     print(f"GitLab MCP: Using preset '{preset_name}'", file=sys.stderr)
                     break
         
@@ -1,15 +1,21 @@
 """FastMCP server for GitLab REST API."""
 
 import asyncio
+import contextlib
+import copy
+import io
 import os
 import json
-from typing import Any, Dict, List, Optional, Set
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
 
 from fastmcp import FastMCP
-from pydantic import Field
+from pydantic import Field, validate_call
 
-from .client import GitLabClient, GitLabConfig
+from .client import MAX_CONCURRENT_REQUESTS, GitLabClient, GitLabConfig
 from .filtered_mcp import FilteredMCP
+from .utils import wrap_response
 from .api.core.projects import register as register_projects_tools
 from .api.core.groups import register as register_groups_tools
 from .api.core.users import register as register_users_tools
@@ -64,59 +70,76 @@ try:
 except Exception:
     pass
 
+# API domain registrars, in registration order
+_REGISTRARS: Tuple[Callable[[FilteredMCP], None], ...] = (
+    register_projects_tools,
+    register_groups_tools,
+    register_users_tools,
+    register_issues_tools,
+    register_merge_requests_tools,
+    register_commits_tools,
+    register_repository_tools,
+    register_pipelines_tools,
+    register_releases_tools,
+    register_milestones_tools,
+    register_labels_tools,
+    register_wikis_tools,
+    register_snippets_tools,
+    register_tags_tools,
+    register_notes_tools,
+    register_discussions_tools,
+    register_protected_branches_tools,
+    register_runners_tools,
+    register_variables_tools,
+    register_webhooks_tools,
+    register_deploy_keys_tools,
+    register_environments_tools,
+    register_search_tools,
+    register_packages_tools,
+    register_lint_tools,
+    register_preferences_tools,
+    register_todos_tools,
+    register_notifications_tools,
+    register_events_tools,
+    register_services_tools,
+    register_statistics_tools,
+    register_keys_tools,
+    register_license_tools,
+    register_system_hooks_tools,
+    register_feature_flags_tools,
+    register_feature_flag_user_lists_tools,
+    register_flipper_features_tools,
+    register_container_registry_tools,
+    register_error_tracking_tools,
+    register_deploy_tokens_tools,
+    register_deployments_tools,
+    register_analytics_tools,
+    register_dependency_proxy_tools,
+    register_freeze_periods_tools,
+)
+
+
 def register_all_tools(mcp_instance: FilteredMCP) -> None:
-    """Register all API domain tools on the provided MCP instance."""
-    register_projects_tools(mcp_instance)
-    register_groups_tools(mcp_instance)
-    register_users_tools(mcp_instance)
-    register_issues_tools(mcp_instance)
-    register_merge_requests_tools(mcp_instance)
-    register_commits_tools(mcp_instance)
-    register_repository_tools(mcp_instance)
-    register_pipelines_tools(mcp_instance)
-    register_releases_tools(mcp_instance)
-    register_milestones_tools(mcp_instance)
-    register_labels_tools(mcp_instance)
-    register_wikis_tools(mcp_instance)
-    register_snippets_tools(mcp_instance)
-    register_tags_tools(mcp_instance)
-    register_notes_tools(mcp_instance)
-    register_discussions_tools(mcp_instance)
-    register_protected_branches_tools(mcp_instance)
-    register_runners_tools(mcp_instance)
-    register_variables_tools(mcp_instance)
-    register_webhooks_tools(mcp_instance)
-    register_deploy_keys_tools(mcp_instance)
-    register_environments_tools(mcp_instance)
-    register_search_tools(mcp_instance)
-    register_packages_tools(mcp_instance)
-    register_lint_tools(mcp_instance)
-    register_preferences_tools(mcp_instance)
-    register_todos_tools(mcp_instance)
-    register_notifications_tools(mcp_instance)
-    register_events_tools(mcp_instance)
-    register_services_tools(mcp_instance)
-    register_statistics_tools(mcp_instance)
-    register_keys_tools(mcp_instance)
-    register_license_tools(mcp_instance)
-    register_system_hooks_tools(mcp_instance)
-    register_feature_flags_tools(mcp_instance)
-    register_feature_flag_user_lists_tools(mcp_instance)
-    register_flipper_features_tools(mcp_instance)
-    register_container_registry_tools(mcp_instance)
-    register_error_tracking_tools(mcp_instance)
-    register_deploy_tokens_tools(mcp_instance)
-    register_deployments_tools(mcp_instance)
-    register_analytics_tools(mcp_instance)
-    register_dependency_proxy_tools(mcp_instance)
-    register_freeze_periods_tools(mcp_instance)
+    """Register all API domain tools on the provided MCP instance.
+
+    Registration must stay sequential on a single thread: FilteredMCP
+    reserves standardized names in call order (collisions get numeric
+    suffixes), and the FastMCP tool manager is not thread-safe.
+    """
+    for register in _REGISTRARS:
+        register(mcp_instance)
 
 # Global GitLab client
 _gitlab_client: Optional[GitLabClient] = None
 
 
 async def get_gitlab_client() -> GitLabClient:
-    """Get or create GitLab client instance."""
+    """Get or create GitLab client instance.
+
+    Tools call this on every invocation rather than binding a module-level
+    client: once the client exists this is a single None check, it keeps
+    configuration lazy until the first call, and it is the seam tests patch.
+    """
     global _gitlab_client
     if _gitlab_client is None:
         config = GitLabConfig(
@@ -127,6 +150,91 @@ async def get_gitlab_client() -> GitLabClient:
     return _gitlab_client
 
 
+def _compact(**kw: Any) -> Dict[str, Any]:
+    """Return the keyword arguments whose values are not None."""
+    return {k: v for k, v in kw.items() if v is not None}
+
+
+def _path_segment(value: str) -> str:
+    """URL-encode a value for use as a single path segment.
+
+    Branch names such as ``feature/login`` must be sent as
+    ``feature%2Flogin``. The value is taken literally and encoded exactly
+    once, so pass the raw name: a ``%`` in it is sent as ``%25``.
+    """
+    return quote(value, safe="")
+
+
+def _normalize(result: Any) -> Dict[str, Any]:
+    """Convert a concurrent call result or exception into a response dict."""
+    if isinstance(result, BaseException):
+        return {"error": str(result), "error_type": type(result).__name__}
+    return wrap_response(result)
+
+
+# Response cache for idempotent GET endpoints whose results change rarely.
+# Keys are (path, sorted params); values are (fetched_at, response).
+_response_cache: Dict[tuple, tuple] = {}
+
+# TTL in seconds per endpoint prefix; only these endpoints are cached.
+# Bulk imports are left out on purpose: their status changes while an import
+# runs and callers poll get_bulk_import to watch it progress.
+# Write tools clear their prefix in a finally block after the request, so a
+# read racing the write cannot re-cache the pre-write response.
+_CACHE_TTLS: Dict[str, float] = {
+    "/metadata": 300,
+    "/version": 300,
+    "/broadcast_messages": 30,
+    "/admin/ci/variables": 15,
+    "/admin/clusters": 15,
+}
+
+
+def _cache_ttl(path: str) -> Optional[float]:
+    """Return the cache TTL for a path, or None if it is not cacheable."""
+    for prefix, ttl in _CACHE_TTLS.items():
+        if path == prefix or path.startswith(prefix + "/"):
+            return ttl
+    return None
+
+
+def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> tuple:
+    """Build a hashable cache key from a path and query parameters."""
+    if not params:
+        return (path, ())
+    items = tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+    ))
+    return (path, items)
+
+
+async def cached_get(
+    client: GitLabClient, path: str, params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """GET a whitelisted endpoint, serving repeated calls from the TTL cache."""
+    ttl = _cache_ttl(path)
+    if ttl is None:
+        return await client.get(path, params=params)
+
+    key = _cache_key(path, params)
+    hit = _response_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return copy.deepcopy(hit[1])
+
+    result = await client.get(path, params=params)
+    _response_cache[key] = (time.monotonic(), result)
+    return copy.deepcopy(result)
+
+
+def clear_cache(prefix: Optional[str] = None) -> None:
+    """Drop cached responses, optionally only those under a path prefix."""
+    if prefix is None:
+        _response_cache.clear()
+        return
+    for key in [k for k in _response_cache if k[0].startswith(prefix)]:
+        del _response_cache[key]
+
+
 # Access Requests Tools
 @mcp.tool()
 async def list_group_access_requests(
@@ -154,9 +262,7 @@ async def approve_group_access_request(
 ) -> Dict[str, Any]:
     """Approve an access request for a group."""
     client = await get_gitlab_client()
-    data = {}
-    if access_level is not None:
-        data["access_level"] = access_level
+    data = _compact(access_level=access_level)
     return await client.put(f"/groups/{group_id}/access_requests/{user_id}/approve", json_data=data)
 
 
@@ -196,9 +302,7 @@ async def approve_project_access_request(
 ) -> Dict[str, Any]:
     """Approve an access request for a project."""
     client = await get_gitlab_client()
-    data = {}
-    if access_level is not None:
-        data["access_level"] = access_level
+    data = _compact(access_level=access_level)
     return await client.put(f"/projects/{project_id}/access_requests/{user_id}/approve", json_data=data)
 
 
@@ -244,11 +348,7 @@ async def upload_alert_metric_image(
 ) -> Dict[str, Any]:
     """Upload a metric image for an alert."""
     client = await get_gitlab_client()
-    data = {}
-    if url:
-        data["url"] = url
-    if url_text:
-        data["url_text"] = url_text
+    data = _compact(url=url, url_text=url_text)
     
     # Note: File upload would need special handling in real implementation
     return await client.post(f"/projects/{project_id}/alert_management_alerts/{alert_iid}/metric_images", data=data)
@@ -285,11 +385,7 @@ async def update_alert_metric_image(
 ) -> Dict[str, Any]:
     """Update a metric image for an alert."""
     client = await get_gitlab_client()
-    data = {}
-    if url:
-        data["url"] = url
-    if url_text:
-        data["url_text"] = url_text
+    data = _compact(url=url, url_text=url_text)
     return await client.put(f"/projects/{project_id}/alert_management_alerts/{alert_iid}/metric_images/{metric_image_id}", json_data=data)
 
 
@@ -329,23 +425,20 @@ async def update_application_appearance(
 ) -> Dict[str, Any]:
     """Update application appearance settings."""
     client = await get_gitlab_client()
-    data = {}
-    for key, value in {
-        "title": title,
-        "description": description,
-        "logo": logo,
-        "header_logo": header_logo,
-        "favicon": favicon,
-        "new_project_guidelines": new_project_guidelines,
-        "profile_image_guidelines": profile_image_guidelines,
-        "header_message": header_message,
-        "footer_message": footer_message,
-        "message_background_color": message_background_color,
-        "message_font_color": message_font_color,
-        "email_header_and_footer_enabled": email_header_and_footer_enabled,
-    }.items():
-        if value is not None:
-            data[key] = value
+    data = _compact(
+        title=title,
+        description=description,
+        logo=logo,
+        header_logo=header_logo,
+        favicon=favicon,
+        new_project_guidelines=new_project_guidelines,
+        profile_image_guidelines=profile_image_guidelines,
+        header_message=header_message,
+        footer_message=footer_message,
+        message_background_color=message_background_color,
+        message_font_color=message_font_color,
+        email_header_and_footer_enabled=email_header_and_footer_enabled,
+    )
     return await client.put("/application/appearance", json_data=data)
 
 
@@ -376,25 +469,25 @@ async def update_application_plan_limits(
 ) -> Dict[str, Any]:
     """Update application plan limits."""
     client = await get_gitlab_client()
-    data = {"plan_name": plan_name}
-    for key, value in {
-        "ci_pipeline_size": ci_pipeline_size,
-        "ci_active_jobs": ci_active_jobs,
-        "ci_project_subscriptions": ci_project_subscriptions,
-        "ci_pipeline_schedules": ci_pipeline_schedules,
-        "ci_needs_size_limit": ci_needs_size_limit,
-        "ci_registered_group_runners": ci_registered_group_runners,
-        "ci_registered_project_runners": ci_registered_project_runners,
-        "conan_max_file_size": conan_max_file_size,
-        "maven_max_file_size": maven_max_file_size,
-        "npm_max_file_size": npm_max_file_size,
-        "nuget_max_file_size": nuget_max_file_size,
-        "pypi_max_file_size": pypi_max_file_size,
-        "terraform_module_max_file_size": terraform_module_max_file_size,
-        "storage_size_limit": storage_size_limit,
-    }.items():
-        if value is not None:
-            data[key] = value
+    data = {
+        "plan_name": plan_name,
+        **_compact(
+            ci_pipeline_size=ci_pipeline_size,
+            ci_active_jobs=ci_active_jobs,
+            ci_project_subscriptions=ci_project_subscriptions,
+            ci_pipeline_schedules=ci_pipeline_schedules,
+            ci_needs_size_limit=ci_needs_size_limit,
+            ci_registered_group_runners=ci_registered_group_runners,
+            ci_registered_project_runners=ci_registered_project_runners,
+            conan_max_file_size=conan_max_file_size,
+            maven_max_file_size=maven_max_file_size,
+            npm_max_file_size=npm_max_file_size,
+            nuget_max_file_size=nuget_max_file_size,
+            pypi_max_file_size=pypi_max_file_size,
+            terraform_module_max_file_size=terraform_module_max_file_size,
+            storage_size_limit=storage_size_limit,
+        ),
+    }
     return await client.put("/application/plan_limits", json_data=data)
 
 
@@ -440,9 +533,7 @@ async def get_avatar(
 ) -> Dict[str, Any]:
     """Get avatar URL for an email address."""
     client = await get_gitlab_client()
-    params = {"email": email}
-    if size:
-        params["size"] = size
+    params = {"email": email, **_compact(size=size)}
     return await client.get("/avatar", params=params)
 
 
@@ -454,10 +545,7 @@ async def list_group_badges(
 ) -> Dict[str, Any]:
     """List group badges."""
     client = await get_gitlab_client()
-    params = {}
-    if name:
-        params["name"] = name
-    return await client.get(f"/groups/{group_id}/badges", params=params)
+    return await client.get(f"/groups/{group_id}/badges", params=_compact(name=name))
 
 
 @mcp.tool()
@@ -469,12 +557,7 @@ async def create_group_badge(
 ) -> Dict[str, Any]:
     """Create a group badge."""
     client = await get_gitlab_client()
-    data = {
-        "link_url": link_url,
-        "image_url": image_url
-    }
-    if name:
-        data["name"] = name
+    data = {"link_url": link_url, "image_url": image_url, **_compact(name=name)}
     return await client.post(f"/groups/{group_id}/badges", json_data=data)
 
 
@@ -498,14 +581,11 @@ async def update_group_badge(
 ) -> Dict[str, Any]:
     """Update a group badge."""
     client = await get_gitlab_client()
-    data = {}
-    for key, value in {
-        "link_url": link_url,
-        "image_url": image_url,
-        "name": name
-    }.items():
-        if value is not None:
-            data[key] = value
+    data = _compact(
+        link_url=link_url,
+        image_url=image_url,
+        name=name,
+    )
     return await client.put(f"/groups/{group_id}/badges/{badge_id}", json_data=data)
 
 
@@ -541,10 +621,7 @@ async def list_project_badges(
 ) -> Dict[str, Any]:
     """List project badges."""
     client = await get_gitlab_client()
-    params = {}
-    if name:
-        params["name"] = name
-    return await client.get(f"/projects/{project_id}/badges", params=params)
+    return await client.get(f"/projects/{project_id}/badges", params=_compact(name=name))
 
 
 @mcp.tool()
@@ -556,12 +633,7 @@ async def create_project_badge(
 ) -> Dict[str, Any]:
     """Create a project badge."""
     client = await get_gitlab_client()
-    data = {
-        "link_url": link_url,
-        "image_url": image_url
-    }
-    if name:
-        data["name"] = name
+    data = {"link_url": link_url, "image_url": image_url, **_compact(name=name)}
     return await client.post(f"/projects/{project_id}/badges", json_data=data)
 
 
@@ -585,14 +657,11 @@ async def update_project_badge(
 ) -> Dict[str, Any]:
     """Update a project badge."""
     client = await get_gitlab_client()
-    data = {}
-    for key, value in {
-        "link_url": link_url,
-        "image_url": image_url,
-        "name": name
-    }.items():
-        if value is not None:
-            data[key] = value
+    data = _compact(
+        link_url=link_url,
+        image_url=image_url,
+        name=name,
+    )
     return await client.put(f"/projects/{project_id}/badges/{badge_id}", json_data=data)
 
 
@@ -628,10 +697,7 @@ async def list_batched_background_migrations(
 ) -> Dict[str, Any]:
     """List batched background migrations."""
     client = await get_gitlab_client()
-    params = {}
-    if database:
-        params["database"] = database
-    return await client.get("/admin/batched_background_migrations", params=params)
+    return await client.get("/admin/batched_background_migrations", params=_compact(database=database))
 
 
 @mcp.tool()
@@ -641,10 +707,7 @@ async def get_batched_background_migration(
 ) -> Dict[str, Any]:
     """Get a batched background migration."""
     client = await get_gitlab_client()
-    params = {}
-    if database:
-        params["database"] = database
-    return await client.get(f"/admin/batched_background_migrations/{migration_id}", params=params)
+    return await client.get(f"/admin/batched_background_migrations/{migration_id}", params=_compact(database=database))
 
 
 @mcp.tool()
@@ -654,9 +717,7 @@ async def pause_batched_background_migration(
 ) -> Dict[str, Any]:
     """Pause a batched background migration."""
     client = await get_gitlab_client()
-    data = {}
-    if database:
-        data["database"] = database
+    data = _compact(database=database)
     return await client.put(f"/admin/batched_background_migrations/{migration_id}/pause", json_data=data)
 
 
@@ -667,9 +728,7 @@ async def resume_batched_background_migration(
 ) -> Dict[str, Any]:
     """Resume a batched background migration."""
     client = await get_gitlab_client()
-    data = {}
-    if database:
-        data["database"] = database
+    data = _compact(database=database)
     return await client.put(f"/admin/batched_background_migrations/{migration_id}/resume", json_data=data)
 
 
@@ -681,20 +740,17 @@ async def list_repository_branches(
 ) -> Dict[str, Any]:
     """List repository branches."""
     client = await get_gitlab_client()
-    params = {}
-    if search:
-        params["search"] = search
-    return await client.get(f"/projects/{project_id}/repository/branches", params=params)
+    return await client.get(f"/projects/{project_id}/repository/branches", params=_compact(search=search))
 
 
 @mcp.tool()
 async def get_repository_branch(
     project_id: str = Field(description="The ID or URL-encoded path of the project"),
-    branch_name: str = Field(description="The name of the branch")
+    branch_name: str = Field(description="The name of the branch, not URL-encoded")
 ) -> Dict[str, Any]:
     """Get a single repository branch."""
     client = await get_gitlab_client()
-    return await client.get(f"/projects/{project_id}/repository/branches/{branch_name}")
+    return await client.get(f"/projects/{project_id}/repository/branches/{_path_segment(branch_name)}")
 
 
 @mcp.tool()
@@ -715,11 +771,11 @@ async def create_repository_branch(
 @mcp.tool()
 async def delete_repository_branch(
     project_id: str = Field(description="The ID or URL-encoded path of the project"),
-    branch_name: str = Field(description="The name of the branch")
+    branch_name: str = Field(description="The name of the branch, not URL-encoded")
 ) -> Dict[str, Any]:
     """Delete a repository branch."""
     client = await get_gitlab_client()
-    return await client.delete(f"/projects/{project_id}/repository/branches/{branch_name}")
+    return await client.delete(f"/projects/{project_id}/repository/branches/{_path_segment(branch_name)}")
 
 
 @mcp.tool()
@@ -742,12 +798,9 @@ async def list_broadcast_messages(
 ) -> Dict[str, Any]:
     """List broadcast messages."""
     client = await get_gitlab_client()
-    params = {}
-    if page:
-        params["page"] = page
-    if per_page:
-        params["per_page"] = per_page
-    return await client.get("/broadcast_messages", params=params)
+    return await cached_get(
+        client, "/broadcast_messages", params=_compact(page=page, per_page=per_page)
+    )
 
 
 @mcp.tool()
@@ -756,7 +809,7 @@ async def get_broadcast_message(
 ) -> Dict[str, Any]:
     """Get a broadcast message."""
     client = await get_gitlab_client()
-    return await client.get(f"/broadcast_messages/{message_id}")
+    return await cached_get(client, f"/broadcast_messages/{message_id}")
 
 
 @mcp.tool()
@@ -773,20 +826,23 @@ async def create_broadcast_message(
 ) -> Dict[str, Any]:
     """Create a broadcast message."""
     client = await get_gitlab_client()
-    data = {"message": message}
-    for key, value in {
-        "starts_at": starts_at,
-        "ends_at": ends_at,
-        "color": color,
-        "font": font,
-        "target_access_levels": target_access_levels,
-        "target_path": target_path,
-        "broadcast_type": broadcast_type,
-        "dismissible": dismissible
-    }.items():
-        if value is not None:
-            data[key] = value
-    return await client.post("/broadcast_messages", json_data=data)
+    data = {
+        "message": message,
+        **_compact(
+            starts_at=starts_at,
+            ends_at=ends_at,
+            color=color,
+            font=font,
+            target_access_levels=target_access_levels,
+            target_path=target_path,
+            broadcast_type=broadcast_type,
+            dismissible=dismissible,
+        ),
+    }
+    try:
+        return await client.post("/broadcast_messages", json_data=data)
+    finally:
+        clear_cache("/broadcast_messages")
 
 
 @mcp.tool()
@@ -804,21 +860,21 @@ async def update_broadcast_message(
 ) -> Dict[str, Any]:
     """Update a broadcast message."""
     client = await get_gitlab_client()
-    data = {}
-    for key, value in {
-        "message": message,
-        "starts_at": starts_at,
-        "ends_at": ends_at,
-        "color": color,
-        "font": font,
-        "target_access_levels": target_access_levels,
-        "target_path": target_path,
-        "broadcast_type": broadcast_type,
-        "dismissible": dismissible
-    }.items():
-        if value is not None:
-            data[key] = value
-    return await client.put(f"/broadcast_messages/{message_id}", json_data=data)
+    data = _compact(
+        message=message,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        color=color,
+        font=font,
+        target_access_levels=target_access_levels,
+        target_path=target_path,
+        broadcast_type=broadcast_type,
+        dismissible=dismissible,
+    )
+    try:
+        return await client.put(f"/broadcast_messages/{message_id}", json_data=data)
+    finally:
+        clear_cache("/broadcast_messages")
 
 
 @mcp.tool()
@@ -827,7 +883,10 @@ async def delete_broadcast_message(
 ) -> Dict[str, Any]:
     """Delete a broadcast message."""
     client = await get_gitlab_client()
-    return await client.delete(f"/broadcast_messages/{message_id}")
+    try:
+        return await client.delete(f"/broadcast_messages/{message_id}")
+    finally:
+        clear_cache("/broadcast_messages")
 
 
 # Bulk Imports Tools
@@ -840,18 +899,30 @@ async def list_bulk_imports(
 ) -> Dict[str, Any]:
     """List bulk imports."""
     client = await get_gitlab_client()
-    params = {}
-    for key, value in {
-        "page": page,
-        "per_page": per_page,
-        "sort": sort,
-        "status": status
-    }.items():
-        if value is not None:
-            params[key] = value
+    params = _compact(
+        page=page,
+        per_page=per_page,
+        sort=sort,
+        status=status,
+    )
     return await client.get("/bulk_imports", params=params)
 
 
+@mcp.tool()
+async def list_bulk_imports_each_page(
+    sort: Optional[str] = Field(default=None, description="Sort order (asc or desc)"),
+    status: Optional[str] = Field(default=None, description="Filter by status"),
+    max_pages: int = Field(default=10, ge=1, description="Maximum number of pages of 100 items to fetch")
+) -> Dict[str, Any]:
+    """List bulk imports across all pages (up to max_pages), fetching pages concurrently.
+
+    When max_pages cuts the listing short, truncated is true and next_page is
+    the first page that was not fetched.
+    """
+    client = await get_gitlab_client()
+    return await client.get_all_pages("/bulk_imports", params=_compact(sort=sort, status=status), max_pages=max_pages)
+
+
 @mcp.tool()
 async def get_bulk_import(
     import_id: str = Field(description="The bulk import ID")
@@ -871,15 +942,12 @@ async def list_bulk_import_entities(
 ) -> Dict[str, Any]:
     """List bulk import entities."""
     client = await get_gitlab_client()
-    params = {}
-    for key, value in {
-        "page": page,
-        "per_page": per_page,
-        "status": status,
-        "source_type": source_type
-    }.items():
-        if value is not None:
-            params[key] = value
+    params = _compact(
+        page=page,
+        per_page=per_page,
+        status=status,
+        source_type=source_type,
+    )
     
     if import_id:
         return await client.get(f"/bulk_imports/{import_id}/entities", params=params)
@@ -902,7 +970,7 @@ async def get_bulk_import_entity(
 async def list_admin_ci_variables() -> Dict[str, Any]:
     """List all admin CI variables."""
     client = await get_gitlab_client()
-    return await client.get("/admin/ci/variables")
+    return await cached_get(client, "/admin/ci/variables")
 
 
 @mcp.tool()
@@ -911,7 +979,7 @@ async def get_admin_ci_variable(
 ) -> Dict[str, Any]:
     """Get an admin CI variable."""
     client = await get_gitlab_client()
-    return await client.get(f"/admin/ci/variables/{key}")
+    return await cached_get(client, f"/admin/ci/variables/{key}")
 
 
 @mcp.tool()
@@ -931,7 +999,10 @@ async def create_admin_ci_variable(
         "protected": protected,
         "masked": masked
     }
-    return await client.post("/admin/ci/variables", json_data=data)
+    try:
+        return await client.post("/admin/ci/variables", json_data=data)
+    finally:
+        clear_cache("/admin/ci/variables")
 
 
 @mcp.tool()
@@ -944,16 +1015,16 @@ async def update_admin_ci_variable(
 ) -> Dict[str, Any]:
     """Update an admin CI variable."""
     client = await get_gitlab_client()
-    data = {}
-    for param_key, value in {
-        "value": value,
-        "variable_type": variable_type,
-        "protected": protected,
-        "masked": masked
-    }.items():
-        if value is not None:
-            data[param_key] = value
-    return await client.put(f"/admin/ci/variables/{key}", json_data=data)
+    data = _compact(
+        value=value,
+        variable_type=variable_type,
+        protected=protected,
+        masked=masked,
+    )
+    try:
+        return await client.put(f"/admin/ci/variables/{key}", json_data=data)
+    finally:
+        clear_cache("/admin/ci/variables")
 
 
 @mcp.tool()
@@ -962,7 +1033,10 @@ async def delete_admin_ci_variable(
 ) -> Dict[str, Any]:
     """Delete an admin CI variable."""
     client = await get_gitlab_client()
-    return await client.delete(f"/admin/ci/variables/{key}")
+    try:
+        return await client.delete(f"/admin/ci/variables/{key}")
+    finally:
+        clear_cache("/admin/ci/variables")
 
 
 # Clusters Tools
@@ -970,7 +1044,7 @@ async def delete_admin_ci_variable(
 async def list_admin_clusters() -> Dict[str, Any]:
     """List all admin clusters."""
     client = await get_gitlab_client()
-    return await client.get("/admin/clusters")
+    return await cached_get(client, "/admin/clusters")
 
 
 @mcp.tool()
@@ -979,7 +1053,7 @@ async def get_admin_cluster(
 ) -> Dict[str, Any]:
     """Get an admin cluster."""
     client = await get_gitlab_client()
-    return await client.get(f"/admin/clusters/{cluster_id}")
+    return await cached_get(client, f"/admin/clusters/{cluster_id}")
 
 
 @mcp.tool()
@@ -993,7 +1067,10 @@ async def add_admin_cluster(
         "name": name,
         "platform_kubernetes_attributes": platform_kubernetes_attributes
     }
-    return await client.post("/admin/clusters/add", json_data=data)
+    try:
+        return await client.post("/admin/clusters/add", json_data=data)
+    finally:
+        clear_cache("/admin/clusters")
 
 
 @mcp.tool()
@@ -1004,12 +1081,14 @@ async def update_admin_cluster(
 ) -> Dict[str, Any]:
     """Update an admin cluster."""
     client = await get_gitlab_client()
-    data = {}
-    if name:
-        data["name"] = name
-    if platform_kubernetes_attributes:
-        data["platform_kubernetes_attributes"] = platform_kubernetes_attributes
-    return await client.put(f"/admin/clusters/{cluster_id}", json_data=data)
+    data = _compact(
+        name=name,
+        platform_kubernetes_attributes=platform_kubernetes_attributes,
+    )
+    try:
+        return await client.put(f"/admin/clusters/{cluster_id}", json_data=data)
+    finally:
+        clear_cache("/admin/clusters")
 
 
 @mcp.tool()
@@ -1018,7 +1097,10 @@ async def delete_admin_cluster(
 ) -> Dict[str, Any]:
     """Delete an admin cluster."""
     client = await get_gitlab_client()
-    return await client.delete(f"/admin/clusters/{cluster_id}")
+    try:
+        return await client.delete(f"/admin/clusters/{cluster_id}")
+    finally:
+        clear_cache("/admin/clusters")
 
 
 # Jobs Tools
@@ -1029,10 +1111,22 @@ async def list_project_jobs(
 ) -> Dict[str, Any]:
     """List project jobs."""
     client = await get_gitlab_client()
-    params = {}
-    if scope:
-        params["scope"] = scope
-    return await client.get(f"/projects/{project_id}/jobs", params=params)
+    return await client.get(f"/projects/{project_id}/jobs", params=_compact(scope=scope))
+
+
+@mcp.tool()
+async def list_project_jobs_each_page(
+    project_id: str = Field(description="The ID or URL-encoded path of the project"),
+    scope: Optional[List[str]] = Field(default=None, description="Scope of jobs to show"),
+    max_pages: int = Field(default=10, ge=1, description="Maximum number of pages of 100 items to fetch")
+) -> Dict[str, Any]:
+    """List project jobs across all pages (up to max_pages), fetching pages concurrently.
+
+    When max_pages cuts the listing short, truncated is true and next_page is
+    the first page that was not fetched.
+    """
+    client = await get_gitlab_client()
+    return await client.get_all_pages(f"/projects/{project_id}/jobs", params=_compact(scope=scope), max_pages=max_pages)
 
 
 @mcp.tool()
@@ -1090,14 +1184,14 @@ async def play_project_job(
 async def get_metadata() -> Dict[str, Any]:
     """Get GitLab metadata."""
     client = await get_gitlab_client()
-    return await client.get("/metadata")
+    return await cached_get(client, "/metadata")
 
 
 @mcp.tool()
 async def get_version() -> Dict[str, Any]:
     """Get GitLab version information."""
     client = await get_gitlab_client()
-    return await client.get("/version")
+    return await cached_get(client, "/version")
 
 
 # Migrations Tools
@@ -1110,6 +1204,72 @@ async def mark_migration_as_successful(
     return await client.post(f"/admin/migrations/{timestamp}/mark")
 
 
+@mcp.tool()
+async def bulk_mark_migrations_as_successful(
+    timestamps: List[str] = Field(description="The migration timestamps")
+) -> Dict[str, Any]:
+    """Mark several migrations as successful concurrently. Results are returned in request order."""
+    client = await get_gitlab_client()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def mark(timestamp: str) -> Any:
+        async with semaphore:
+            return await client.post(f"/admin/migrations/{timestamp}/mark")
+
+    results = await asyncio.gather(*(mark(t) for t in timestamps), return_exceptions=True)
+    return {
+        "results": [{"timestamp": t, **_normalize(r)} for t, r in zip(timestamps, results)],
+        "count": len(results),
+    }
+
+
+# Batch Tools
+# Most calls accepted by one call_many request
+_MAX_BATCH_CALLS = 100
+
+# Validated handlers for registered tools, keyed by the name used in batch calls
+_TOOL_DISPATCH: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+
+def _resolve_tool(name: str) -> Callable[..., Awaitable[Any]]:
+    """Look up a registered tool by standardized or original name."""
+    handler = _TOOL_DISPATCH.get(name)
+    if handler is not None:
+        return handler
+
+    tools = mcp._mcp._tool_manager._tools
+    std_name = name if name in tools else mcp._aliases.get(name)
+    if std_name not in tools or mcp._aliases.get("call_many") == std_name:
+        raise ValueError(f"Unknown tool: {name}")
+
+    # validate_call resolves Field defaults and coerces arguments like MCP does
+    handler = validate_call(tools[std_name].fn)
+    _TOOL_DISPATCH[name] = handler
+    return handler
+
+
+@mcp.tool()
+async def call_many(
+    calls: List[Dict[str, Any]] = Field(description=f'Tool calls to run concurrently (at most {_MAX_BATCH_CALLS}, {MAX_CONCURRENT_REQUESTS} at a time), each as {{"tool": "<tool name>", "args": {{...}}}}')
+) -> Dict[str, Any]:
+    """Run several tool calls concurrently. Results are returned in request order.
+
+    Any registered tool can be called, including ones that create, change or
+    delete data.
+    """
+    if len(calls) > _MAX_BATCH_CALLS:
+        raise ValueError(f"Too many calls: {len(calls)} (limit {_MAX_BATCH_CALLS})")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def run_call(call: Dict[str, Any]) -> Any:
+        handler = _resolve_tool(call["tool"])
+        async with semaphore:
+            return await handler(**(call.get("args") or {}))
+
+    results = await asyncio.gather(*(run_call(c) for c in calls), return_exceptions=True)
+    return {"results": [_normalize(r) for r in results], "count": len(results)}
+
+
 # Register all tools - filtering is handled by FilteredMCP
 register_all_tools(mcp)
 
@@ -1120,25 +1280,36 @@ def get_mcp_server() -> FilteredMCP:
     return instance
 
 
+class _DiscardingWriter(io.TextIOBase):
+    """In-memory text sink that drops everything written to it."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
 def main():
     """Run the MCP server in stdio mode for Claude integration."""
-    import os
-    import sys
     import logging
     
-    # Suppress all logging for clean stdio communication
-    logging.getLogger().setLevel(logging.CRITICAL)
-    logging.getLogger("fastmcp").setLevel(logging.CRITICAL)
+    # Suppress all logging for clean stdio communication; disabled records
+    # are dropped before any handler formats them
+    logging.disable(logging.CRITICAL)
+    
+    # Use uvloop's faster event loop when installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
-    # Redirect stderr to devnull to suppress FastMCP banner
-    with open(os.devnull, 'w') as devnull:
-        stderr_backup = sys.stderr
-        sys.stderr = devnull
-        try:
-            # Run in stdio mode by default for Claude Desktop/Code CLI compatibility
-            mcp.run(transport="stdio")
-        finally:
-            sys.stderr = stderr_backup
+    # Discard stderr to suppress the FastMCP banner
+    with contextlib.redirect_stderr(_DiscardingWriter()):
+        # Run in stdio mode by default for Claude Desktop/Code CLI compatibility
+        mcp.run(transport="stdio")
 
 
 if __name__ == "__main__":
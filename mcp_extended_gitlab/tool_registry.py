@@ -1,197 +1,170 @@
 """Tool registry for mapping tool names to modules."""
 
-from typing import Dict, List, Set, Tuple
-import inspect
-from .api.core import (
-    projects, groups, users, issues, merge_requests, commits, repository,
-    releases, milestones, labels, wikis, snippets, tags, notes, discussions,
-    search, preferences, todos, notifications, events, webhooks
-)
-from .api.ci_cd import pipelines, runners, variables, lint
-from .api.security import protected_branches, deploy_keys, keys, deploy_tokens
-from .api.devops import (
-    environments, feature_flags, feature_flag_user_lists, deployments,
-    dependency_proxy, freeze_periods
-)
-from .api.registry import packages, container
-from .api.integrations import services
-from .api.monitoring import statistics, error_tracking, analytics
-from .api.admin import license, hooks, flipper_features
-
-
-# Module registry with all available modules
-MODULE_REGISTRY = {
-    # Core modules
-    "projects": projects,
-    "groups": groups,
-    "users": users,
-    "issues": issues,
-    "merge_requests": merge_requests,
-    "commits": commits,
-    "repository": repository,
-    "releases": releases,
-    "milestones": milestones,
-    "labels": labels,
-    "wikis": wikis,
-    "snippets": snippets,
-    "tags": tags,
-    "notes": notes,
-    "discussions": discussions,
-    "search": search,
-    "preferences": preferences,
-    "todos": todos,
-    "notifications": notifications,
-    "events": events,
-    "webhooks": webhooks,
-    
-    # CI/CD modules
-    "pipelines": pipelines,
-    "runners": runners,
-    "variables": variables,
-    "lint": lint,
-    
-    # Security modules
-    "protected_branches": protected_branches,
-    "deploy_keys": deploy_keys,
-    "keys": keys,
-    "deploy_tokens": deploy_tokens,
-    
-    # DevOps modules
-    "environments": environments,
-    "feature_flags": feature_flags,
-    "feature_flag_user_lists": feature_flag_user_lists,
-    "deployments": deployments,
-    "dependency_proxy": dependency_proxy,
-    "freeze_periods": freeze_periods,
-    
-    # Registry modules
-    "packages": packages,
-    "container": container,
-    
-    # Integrations
-    "services": services,
-    
-    # Monitoring modules
-    "statistics": statistics,
-    "error_tracking": error_tracking,
-    "analytics": analytics,
-    
-    # Admin modules
-    "license": license,
-    "hooks": hooks,
-    "flipper_features": flipper_features,
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType, ModuleType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Set, Tuple, Union
+
+
+# Modules belonging to each tool category; each lives at api/<category>/<module>.py
+_CATEGORY_MODULES: Dict[str, Tuple[str, ...]] = {
+    "core": (
+        "projects", "groups", "users", "issues", "merge_requests",
+        "commits", "repository", "releases", "milestones", "labels",
+        "wikis", "snippets", "tags", "notes", "discussions", "search",
+        "preferences", "todos", "notifications", "events", "webhooks",
+    ),
+    "ci_cd": ("pipelines", "runners", "variables", "lint"),
+    "security": ("protected_branches", "deploy_keys", "keys", "deploy_tokens"),
+    "devops": (
+        "environments", "feature_flags", "feature_flag_user_lists",
+        "deployments", "dependency_proxy", "freeze_periods",
+    ),
+    "registry": ("packages", "container"),
+    "integrations": ("services",),
+    "monitoring": ("statistics", "error_tracking", "analytics"),
+    "admin": ("license", "hooks", "flipper_features"),
+    "server": (),  # Tools defined in server.py
 }
 
+# Module registry with all available modules, as paths relative to this package.
+# Modules are imported on first use so that importing the registry stays cheap.
+MODULE_REGISTRY: Mapping[str, str] = MappingProxyType({
+    module_name: f".api.{category}.{module_name}"
+    for category, module_names in _CATEGORY_MODULES.items()
+    for module_name in module_names
+})
 
-def get_module_tools(module) -> List[str]:
-    """Extract tool names from a module by inspecting its register function."""
-    tool_names = []
-    
-    # Get the register function
-    if hasattr(module, 'register'):
-        register_func = module.register
-        
-        # Get the source code of the register function
-        try:
-            source = inspect.getsource(register_func)
-            
-            # Look for @mcp.tool() decorators followed by function definitions
-            lines = source.split('\n')
-            for i, line in enumerate(lines):
-                if '@mcp.tool()' in line:
-                    # Look for the next function definition
-                    for j in range(i + 1, min(i + 10, len(lines))):
-                        if lines[j].strip().startswith('async def '):
-                            # Extract function name
-                            func_line = lines[j].strip()
-                            func_name = func_line.split('async def ')[1].split('(')[0]
-                            tool_names.append(func_name)
-                            break
-        except:
-            pass
-    
-    return tool_names
+_MODULE_TO_CATEGORY: Dict[str, str] = {
+    module_name: category
+    for category, module_names in _CATEGORY_MODULES.items()
+    for module_name in module_names
+}
+
+
+# Tool names per module, recorded the first time a module's tools are requested
+TOOLS_BY_MODULE: Dict[str, Tuple[str, ...]] = {}
+
+
+class _ToolRecorder:
+    """Stand-in for FastMCP whose tool() decorator records names instead of registering."""
+
+    def __init__(self):
+        self.tool_names: List[str] = []
+
+    def tool(self, **kwargs):
+        def decorator(func):
+            self.tool_names.append(func.__name__)
+            return func
+        return decorator
+
+
+def load_module(module_name: str) -> ModuleType:
+    """Import a registered API module by its registry name."""
+    return import_module(MODULE_REGISTRY[module_name], __package__)
+
+
+def get_module_tools(module: Union[ModuleType, str]) -> List[str]:
+    """Get the tool names a module registers, in registration order.
+
+    Accepts either a module object or its MODULE_REGISTRY name; a name is
+    only imported if its tools have not been recorded yet.
+    """
+    if isinstance(module, str):
+        module_name = module
+    else:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+    if module_name not in TOOLS_BY_MODULE:
+        if isinstance(module, str):
+            module = load_module(module_name)
+        recorder = _ToolRecorder()
+        if hasattr(module, 'register'):
+            module.register(recorder)
+        TOOLS_BY_MODULE[module_name] = tuple(recorder.tool_names)
+    return list(TOOLS_BY_MODULE[module_name])
 
 
-def build_tool_to_module_map() -> Dict[str, str]:
-    """Build a mapping from tool names to module names."""
-    tool_map = {}
+class _RegistryIndex(NamedTuple):
+    """Lookup tables derived from the recorded tool names of every module."""
+
+    tool_to_module: Mapping[str, str]
+    module_tools: Mapping[str, FrozenSet[str]]
+    tools_by_category: Mapping[str, Tuple[str, ...]]
+    all_tools: Tuple[str, ...]
+
+
+@cache
+def _build_index() -> _RegistryIndex:
+    """Build every registry lookup table in a single pass over the modules."""
+    tool_map: Dict[str, str] = {}
+    module_tools: Dict[str, FrozenSet[str]] = {}
+    tools_by_category: Dict[str, List[str]] = {category: [] for category in _CATEGORY_MODULES}
     
-    for module_name, module in MODULE_REGISTRY.items():
-        tools = get_module_tools(module)
+    for module_name in MODULE_REGISTRY:
+        tools = get_module_tools(module_name)
+        module_tools[module_name] = frozenset(tools)
+        tools_by_category[_MODULE_TO_CATEGORY.get(module_name, "server")].extend(tools)
         for tool in tools:
             tool_map[tool] = module_name
     
-    return tool_map
+    return _RegistryIndex(
+        tool_to_module=MappingProxyType(tool_map),
+        module_tools=MappingProxyType(module_tools),
+        tools_by_category=MappingProxyType({
+            category: tuple(sorted(tools)) for category, tools in tools_by_category.items()
+        }),
+        all_tools=tuple(sorted(tool_map)),
+    )
+
+
+def invalidate() -> None:
+    """Discard recorded tool names and every cached lookup built from them."""
+    TOOLS_BY_MODULE.clear()
+    _build_index.cache_clear()
+    _get_enabled_modules_cached.cache_clear()
+
+
+def build_tool_to_module_map() -> Mapping[str, str]:
+    """Build a mapping from tool names to module names.
+
+    The result is computed once per process and returned as a read-only view.
+    """
+    return _build_index().tool_to_module
 
 
 def get_enabled_modules(enabled_tools: List[str]) -> Set[str]:
     """Get the set of modules that need to be enabled based on tool names."""
-    tool_map = build_tool_to_module_map()
-    enabled_modules = set()
-    
-    for tool in enabled_tools:
-        if tool in tool_map:
-            enabled_modules.add(tool_map[tool])
-    
-    return enabled_modules
-
-
-def get_all_tools() -> List[str]:
-    """Get all available tool names."""
-    tool_map = build_tool_to_module_map()
-    return sorted(list(tool_map.keys()))
-
-
-def get_tools_by_category() -> Dict[str, List[str]]:
-    """Get tools organized by category."""
-    tools_by_category = {
-        "core": [],
-        "ci_cd": [],
-        "security": [],
-        "devops": [],
-        "registry": [],
-        "integrations": [],
-        "monitoring": [],
-        "admin": [],
-        "server": []  # Tools defined in server.py
-    }
-    
-    tool_map = build_tool_to_module_map()
-    
-    # Categorize by module path
-    for tool, module_name in tool_map.items():
-        if module_name in ["projects", "groups", "users", "issues", "merge_requests", 
-                          "commits", "repository", "releases", "milestones", "labels",
-                          "wikis", "snippets", "tags", "notes", "discussions", "search",
-                          "preferences", "todos", "notifications", "events", "webhooks"]:
-            tools_by_category["core"].append(tool)
-        elif module_name in ["pipelines", "runners", "variables", "lint"]:
-            tools_by_category["ci_cd"].append(tool)
-        elif module_name in ["protected_branches", "deploy_keys", "keys", "deploy_tokens"]:
-            tools_by_category["security"].append(tool)
-        elif module_name in ["environments", "feature_flags", "feature_flag_user_lists",
-                            "deployments", "dependency_proxy", "freeze_periods"]:
-            tools_by_category["devops"].append(tool)
-        elif module_name in ["packages", "container"]:
-            tools_by_category["registry"].append(tool)
-        elif module_name in ["services"]:
-            tools_by_category["integrations"].append(tool)
-        elif module_name in ["statistics", "error_tracking", "analytics"]:
-            tools_by_category["monitoring"].append(tool)
-        elif module_name in ["license", "hooks", "flipper_features"]:
-            tools_by_category["admin"].append(tool)
-    
-    # Sort tools in each category
-    for category in tools_by_category:
-        tools_by_category[category].sort()
-    
-    return tools_by_category
+    return set(_get_enabled_modules_cached(frozenset(enabled_tools)))
+
+
+@cache
+def _get_enabled_modules_cached(enabled_tools: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(
+        module_name
+        for module_name, tools in _build_index().module_tools.items()
+        if not tools.isdisjoint(enabled_tools)
+    )
+
+
+def get_all_tools() -> Tuple[str, ...]:
+    """Get all available tool names, sorted.
 
+    The result is computed once per process and shared.
+    """
+    return _build_index().all_tools
 
-# Common tool presets
-TOOL_PRESETS = {
-    "minimal": [
+
+def get_tools_by_category() -> Mapping[str, Tuple[str, ...]]:
+    """Get tools organized by category, sorted within each category.
+
+    The result is computed once per process and returned as a read-only view.
+    """
+    return _build_index().tools_by_category
+
+
+# Common tool presets, in display order
+TOOL_PRESET_ORDER: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "minimal": (
         # Essential project operations
         "list_projects", "get_single_project", "create_project",
         # Essential issue operations
@@ -202,9 +175,9 @@ TOOL_PRESETS = {
         "get_current_user", "list_users",
         # Essential search
         "search_globally"
-    ],
+    ),
     
-    "core": [
+    "core": (
         # All project tools
         "list_projects", "get_single_project", "create_project", "update_project", "delete_project",
         "fork_project", "star_project", "unstar_project", "project_languages",
@@ -232,9 +205,9 @@ TOOL_PRESETS = {
         
         # Search
         "search_globally", "search_within_project", "search_within_group"
-    ],
+    ),
     
-    "ci_cd": [
+    "ci_cd": (
         # Pipeline tools
         "list_project_pipelines", "get_single_pipeline", "create_pipeline", "retry_jobs_in_pipeline", "cancel_pipeline_jobs",
         "delete_pipeline", "get_pipeline_test_report",
@@ -254,9 +227,9 @@ TOOL_PRESETS = {
         
         # CI lint
         "get_lint_result"
-    ],
+    ),
     
-    "devops": [
+    "devops": (
         # Environment tools
         "list_environments", "get_single_environment", "create_environment", "edit_existing_environment",
         "delete_environment", "stop_environment",
@@ -273,9 +246,9 @@ TOOL_PRESETS = {
         # Package registry
         "list_packages_within_group", "list_packages_within_project", "get_project_package", 
         "delete_project_package", "list_package_files", "delete_package_file"
-    ],
+    ),
     
-    "admin": [
+    "admin": (
         # License tools
         "retrieve_license_information", "add_new_license", "delete_license",
         
@@ -288,5 +261,10 @@ TOOL_PRESETS = {
         
         # Flipper features
         "list_all_features", "set_or_create_feature", "delete_feature"
-    ]
-}
\ No newline at end of file
+    )
+})
+
+# Preset membership sets for O(1) lookups
+TOOL_PRESETS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    name: frozenset(tools) for name, tools in TOOL_PRESET_ORDER.items()
+})
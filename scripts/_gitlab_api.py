@@ -0,0 +1,70 @@
+"""Synchronous GitLab REST helpers shared by the comment and suggestion scripts.
+
+MR diff responses can be large, so JSON is encoded and decoded with orjson
+when it is installed.
+"""
+
+import atexit
+import json
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "mcp-extended-gitlab[fast]"
+    orjson = None
+
+_http: Optional[httpx.Client] = None
+
+
+def _client() -> httpx.Client:
+    """Return the pooled client shared by every request of the run.
+
+    Reusing one keep-alive connection avoids a new TCP+TLS handshake per call.
+    Certificates are not verified (for self-signed certs).
+    """
+    global _http
+    if _http is None:
+        _http = httpx.Client(verify=False, timeout=30)
+        atexit.register(_http.close)
+    return _http
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode data as JSON bytes."""
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
+
+def json_loads(raw: bytes) -> Any:
+    """Decode JSON bytes."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def make_api_request(url: str, token: str, method: str = "GET", data: Optional[Dict] = None) -> Any:
+    """Make an API request to GitLab."""
+    headers = {
+        "Private-Token": token,
+        "Content-Type": "application/json"
+    }
+
+    body = json_dumps(data) if data and method in ["POST", "PUT"] else None
+    response = _client().request(method, url, headers=headers, content=body)
+
+    if response.is_error:
+        print(f"API Error {response.status_code}: {response.text}")
+        response.raise_for_status()
+    return json_loads(response.content)
+
+
+def get_mr_versions(base_url: str, token: str, project_id: str, mr_iid: str) -> Dict[str, Any]:
+    """Get merge request versions to obtain SHA information."""
+    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/versions"
+    versions = make_api_request(url, token)
+    return versions[0] if versions else {}
+
+
+def get_mr_diffs(base_url: str, token: str, project_id: str, mr_iid: str) -> List[Dict[str, Any]]:
+    """Get merge request diff information."""
+    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/diffs"
+    return make_api_request(url, token)
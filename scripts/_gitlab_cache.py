@@ -0,0 +1,93 @@
+"""On-disk cache for merge request GET responses used by the inline comment scripts.
+
+Entries are keyed by the request URL plus a validator derived from the merge
+request, so a changed MR simply misses the cache and old entries are never
+served.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from scripts._gitlab_api import json_dumps, json_loads
+
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp-extended-gitlab"
+
+_MISS = object()
+
+
+def mr_validator(mr_info: Dict[str, Any]) -> Optional[str]:
+    """Return the cache validator for data derived from a merge request.
+
+    Diffs and versions only change when the MR's commits change, so the
+    diff_refs SHAs are preferred: unlike updated_at they survive new comments.
+    """
+    refs = mr_info.get("diff_refs") or {}
+    shas = [refs.get("base_sha"), refs.get("start_sha"), refs.get("head_sha")]
+    if all(shas):
+        return ":".join(shas)
+    return mr_info.get("updated_at")
+
+
+def _cache_file(url: str, validator: str) -> Path:
+    key = hashlib.sha256(f"{url}\n{validator}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def load(url: str, validator: str) -> Any:
+    """Return the cached response for url, or _MISS."""
+    try:
+        raw = _cache_file(url, validator).read_bytes()
+        return json_loads(raw)
+    except (OSError, ValueError):
+        return _MISS
+
+
+def store(url: str, validator: str, data: Any) -> None:
+    """Write a response to the cache; failures only cost the next run a fetch."""
+    tmp = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(tmp, _cache_file(url, validator))
+        tmp = None
+    except (OSError, TypeError, ValueError):
+        pass
+    finally:
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
+
+def _lookup(url: str, validator: Optional[str]) -> Any:
+    """Return the cached response, or _MISS when absent or uncacheable."""
+    return load(url, validator) if validator else _MISS
+
+
+def _fill(url: str, validator: Optional[str], data: Any) -> Any:
+    """Cache a freshly fetched response when it has a validator, and return it."""
+    if validator:
+        store(url, validator, data)
+    return data
+
+
+def cached_call(fetch: Callable[[], Any], url: str, validator: Optional[str]) -> Any:
+    """Return fetch(), cached on disk under url while validator is unchanged."""
+    data = _lookup(url, validator)
+    if data is _MISS:
+        data = _fill(url, validator, fetch())
+    return data
+
+
+async def cached_get(client, path: str, validator: Optional[str]) -> Any:
+    """GitLabClient.get(path), served from disk while validator is unchanged."""
+    url = client._build_url(path)
+    data = _lookup(url, validator)
+    if data is _MISS:
+        data = _fill(url, validator, await client.get(path))
+    return data
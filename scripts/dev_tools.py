@@ -7,10 +7,19 @@ import json
 from typing import List, Optional
 from pathlib import Path
 import ast
+import os
 import re
+import sys
 
-from mcp_extended_gitlab.tools.registry import TOOL_PRESETS, ToolCategory
-from mcp_extended_gitlab.core import Config
+from mcp_extended_gitlab.client import GitLabConfig
+from mcp_extended_gitlab.tool_registry import TOOL_PRESET_ORDER, TOOL_PRESETS
+
+API_DIR = Path(__file__).parent.parent / "mcp_extended_gitlab" / "api"
+SERVER_FILE = API_DIR.parent / "server.py"
+CATEGORIES = sorted(p.name for p in API_DIR.iterdir() if (p / "__init__.py").exists())
+
+# Name of each @mcp.tool() decorated async function, for scans that need no docstrings
+_TOOL_RE = re.compile(rb"@mcp\.tool\([^)]*\)\s*\n\s*async\s+def\s+(\w+)\s*\(")
 
 
 @click.group()
@@ -19,42 +28,48 @@ def cli():
     pass
 
 
+def _scan_file(py_file: Path) -> List[dict]:
+    """Collect info for each @mcp.tool() decorated function in an API file."""
+    content = py_file.read_bytes()
+    if b"@mcp.tool(" not in content:
+        return []
+        
+    # Tools are defined at module level or directly inside register(); nothing deeper
+    tree = ast.parse(content)
+    nodes = list(tree.body)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "register":
+            nodes.extend(node.body)
+    
+    tools = []
+    for node in nodes:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                if (isinstance(decorator, ast.Call) and 
+                    isinstance(decorator.func, ast.Attribute) and
+                    decorator.func.attr == "tool"):
+                    
+                    tools.append({
+                        "name": node.name,
+                        "module": str(py_file.relative_to(API_DIR.parent)),
+                        "description": ast.get_docstring(node) or "No description",
+                        "category": py_file.parent.name
+                    })
+    return tools
+
+
 @cli.command()
-@click.option("--category", type=click.Choice([c.value for c in ToolCategory]), help="Filter by category")
+@click.option("--category", type=click.Choice(CATEGORIES), help="Filter by category")
 @click.option("--output", type=click.Choice(["list", "json", "markdown"]), default="list")
 def list_tools(category: Optional[str], output: str):
     """List all available tools."""
-    tools = []
-    
-    # Scan all API modules for tools
-    api_dir = Path(__file__).parent.parent / "mcp_extended_gitlab" / "api"
-    
-    for py_file in api_dir.rglob("*.py"):
-        if py_file.name == "__init__.py":
-            continue
-            
-        with open(py_file) as f:
-            content = f.read()
-            
-        # Find all @mcp.tool() decorated functions
-        tree = ast.parse(content)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                for decorator in node.decorator_list:
-                    if (isinstance(decorator, ast.Call) and 
-                        isinstance(decorator.func, ast.Attribute) and
-                        decorator.func.attr == "tool"):
-                        
-                        # Extract tool info
-                        tool_info = {
-                            "name": node.name,
-                            "module": str(py_file.relative_to(api_dir.parent)),
-                            "description": ast.get_docstring(node) or "No description",
-                            "category": py_file.parent.name
-                        }
-                        
-                        if not category or tool_info["category"] == category:
-                            tools.append(tool_info)
+    # Scan the API modules for tools, only within the requested category if any
+    scan_dir = API_DIR / category if category else API_DIR
+    tools = [
+        tool
+        for py_file in scan_dir.rglob("*.py") if py_file.name != "__init__.py"
+        for tool in _scan_file(py_file)
+    ]
     
     # Output results
     if output == "json":
@@ -78,9 +93,9 @@ def list_presets():
     """List available tool presets."""
     click.echo("Available tool presets:\n")
     
-    for preset_name, tool_names in TOOL_PRESETS.items():
+    for preset_name, tool_names in TOOL_PRESET_ORDER.items():
         click.echo(f"{preset_name} ({len(tool_names)} tools):")
-        click.echo(f"  {', '.join(tool_names[:5])}", end="")
+        click.echo(f"  {', '.join(tool_names[:5])}", nl=False)
         if len(tool_names) > 5:
             click.echo(f"... and {len(tool_names) - 5} more")
         else:
@@ -110,18 +125,21 @@ def config(check: bool):
     """Manage configuration."""
     if check:
         try:
-            cfg = Config()
+            cfg = GitLabConfig(
+                base_url=os.getenv("GITLAB_BASE_URL", "https://gitlab.com/api/v4"),
+                private_token=os.getenv("GITLAB_PRIVATE_TOKEN")
+            )
+            enabled_tools = os.getenv("GITLAB_ENABLED_TOOLS", "")
             click.echo("Configuration valid!")
             click.echo(f"\nSettings:")
-            click.echo(f"  GitLab URL: {cfg.gitlab_base_url}")
-            click.echo(f"  Token: {'*' * 10}{cfg.gitlab_private_token[-4:] if cfg.gitlab_private_token else 'NOT SET'}")
-            click.echo(f"  Timeout: {cfg.http_timeout}s")
-            click.echo(f"  Log level: {cfg.log_level}")
+            click.echo(f"  GitLab URL: {cfg.base_url}")
+            click.echo(f"  Token: {'*' * 10}{cfg.private_token[-4:] if cfg.private_token else 'NOT SET'}")
+            click.echo(f"  Timeout: {cfg.timeout}s")
             
-            if cfg.enabled_tools:
-                click.echo(f"  Enabled tools: {len(cfg.enabled_tools)} tools")
-            elif cfg.tool_preset:
-                click.echo(f"  Tool preset: {cfg.tool_preset}")
+            if enabled_tools in TOOL_PRESETS:
+                click.echo(f"  Tool preset: {enabled_tools}")
+            elif enabled_tools:
+                click.echo(f"  Enabled tools: {enabled_tools}")
             else:
                 click.echo(f"  Enabled tools: ALL")
                 
@@ -133,24 +151,34 @@ def config(check: bool):
         click.echo("  GITLAB_PRIVATE_TOKEN    - GitLab private access token (required)")
         click.echo("  GITLAB_BASE_URL         - GitLab API URL (default: https://gitlab.com/api/v4)")
         click.echo("  GITLAB_ENABLED_TOOLS    - Tool filter (preset name, tool list, or JSON array)")
-        click.echo("  GITLAB_HTTP_TIMEOUT     - HTTP timeout in seconds (default: 30)")
-        click.echo("  GITLAB_LOG_LEVEL        - Log level (default: WARNING)")
 
 
 @cli.command()
 @click.argument("tool_names", nargs=-1, required=True)
 def check_tools(tool_names: List[str]):
     """Check if specific tools exist."""
-    # This would scan the codebase for the tools
     click.echo(f"Checking tools: {', '.join(tool_names)}")
-    # Implementation would check if tools exist
+    
+    # Tools live in the API modules and, for cross-cutting ones, in server.py
+    known = {
+        name.decode()
+        for py_file in [*API_DIR.rglob("*.py"), SERVER_FILE]
+        for name in _TOOL_RE.findall(py_file.read_bytes())
+    }
+    missing = set(tool_names) - known
+    for tool in tool_names:
+        click.echo(f"  {'MISSING' if tool in missing else 'ok':7s} {tool}")
+    
+    if missing:
+        click.echo(f"\n{len(missing)} unknown tool(s)", err=True)
+        sys.exit(1)
 
 
 @cli.command()
 @click.option("--format", type=click.Choice(["simple", "detailed"]), default="simple")
 def stats(format: str):
     """Show project statistics."""
-    api_dir = Path(__file__).parent.parent / "mcp_extended_gitlab" / "api"
+    api_dir = API_DIR
     
     stats = {
         "modules": 0,
@@ -166,11 +194,10 @@ def stats(format: str):
         stats["files"] += 1
         stats["categories"].add(py_file.parent.name)
         
-        with open(py_file) as f:
-            content = f.read()
+        content = py_file.read_bytes()
             
         # Count @mcp.tool() decorators
-        tool_count = content.count("@mcp.tool(")
+        tool_count = content.count(b"@mcp.tool(")
         stats["tools"] += tool_count
         
         if tool_count > 0:
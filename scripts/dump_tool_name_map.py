@@ -8,10 +8,10 @@ Usage:
 
 import argparse
 import json
-from typing import Dict
+from typing import Dict, List, Tuple
 
 
-def load_mapping() -> Dict[str, str]:
+def load_mapping() -> List[Tuple[str, str]]:
     # Import server and access the FilteredMCP instance
     from mcp_extended_gitlab.server import mcp
 
@@ -35,7 +35,7 @@ def load_mapping() -> Dict[str, str]:
     for orig, std in aliases.items():
         mapping.setdefault(orig, std)
 
-    return dict(sorted(mapping.items(), key=lambda kv: kv[0]))
+    return sorted(mapping.items())
 
 
 def main():
@@ -46,13 +46,13 @@ def main():
     mapping = load_mapping()
 
     if args.json:
-        print(json.dumps(mapping, indent=2, sort_keys=True))
+        print(json.dumps(dict(mapping), indent=2))
         return
 
     # Markdown table
     print("| Original Name | Standardized Name |")
     print("|---|---|")
-    for orig, std in mapping.items():
+    for orig, std in mapping:
         print(f"| `{orig}` | `{std}` |")
 
 
@@ -64,7 +64,7 @@ async def example_3_test_preset_with_json():
         
         # Save to file
         output_file = "minimal_test_report.json"
-        Path(output_file).write_text(json_report)
+        Path(output_file).write_text(json_report, encoding="utf-8")
         print(f"\nJSON report saved to: {output_file}")
 
 
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Create inline comments on specific lines in merge request diffs.
+
+Shared implementation behind test_inline_comment.py, test_inline_comment_simple.py
+and test_inline_comment_advanced.py, which only differ in how they pick the line.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts._gitlab_cache import cached_get, mr_validator
+
+if TYPE_CHECKING:
+    # Importing the package pulls in fastmcp (most of a second); it is
+    # deferred to test_inline_comment so --help and a missing token exit fast
+    from mcp_extended_gitlab.client import GitLabClient
+
+# New-file start line of a hunk header: "@@ -12,5 +14,7 @@" -> 14
+HUNK_RE = re.compile(r'\+(\d+)')
+
+# Lowercase substrings that make an added line worth commenting on
+INTERESTING_PATTERNS = (
+    ("func ", "Swift function"),
+    ("class ", "Class definition"),
+    ("struct ", "Struct definition"),
+    ("def ", "Python function"),
+    ("function ", "Function definition"),
+    ("if ", "Conditional logic"),
+    ("for ", "Loop"),
+    ("import ", "Import statement"),
+    ("assert", "Assertion"),
+    ("test", "Test code"),
+)
+
+COMMENT_SUFFIX = " - Created via MCP Extended GitLab"
+
+# Diff lines of a single file searched for an interesting line; generated
+# files (lockfiles, snapshots) can have 100k+ lines and one match is enough
+MAX_SCAN_LINES = 2000
+
+
+def iter_diff_lines(diff_content: str) -> Iterator[str]:
+    """Yield the lines of a diff lazily, so a scan that stops early never splits the rest."""
+    start = 0
+    while True:
+        end = diff_content.find('\n', start)
+        if end == -1:
+            yield diff_content[start:]
+            return
+        yield diff_content[start:end]
+        start = end + 1
+
+
+def iter_added_lines(diff_content: str, max_lines: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """Yield (new_line_number, content) for every added line among the first max_lines of a diff."""
+    current_line = 0
+    for line in islice(iter_diff_lines(diff_content), max_lines):
+        # Dispatch on the first character; only the rare multi-char markers
+        # need a startswith
+        c = line[:1]
+        if c == "@" and line.startswith("@@"):
+            # Parse line numbers from diff header
+            match = HUNK_RE.search(line)
+            if match:
+                current_line = int(match.group(1)) - 1
+        elif c == "+" and not line.startswith("+++"):
+            current_line += 1
+            yield current_line, line[1:]
+        elif c != "-":
+            current_line += 1
+
+
+def find_first_added_line(diff_content: str) -> Optional[Tuple[int, str, str]]:
+    """Find the first added line of a diff.
+
+    Returns: (line_number, line_content, suggested_comment)
+    """
+    for line_number, content in iter_added_lines(diff_content):
+        return (line_number, content.strip(), "Test inline comment on this line")
+    return None
+
+
+def find_interesting_line(diff_content: str, max_lines: int = MAX_SCAN_LINES) -> Optional[Tuple[int, str, str]]:
+    """Find an interesting line to comment on (e.g., function definition, class, important logic).
+
+    The first max_lines of the diff are scanned once: the first added line
+    matching a pattern wins, otherwise the first meaningful added line seen
+    along the way is used.
+
+    Returns: (line_number, line_content, suggested_comment)
+    """
+    first_meaningful = None
+
+    for line_number, content in iter_added_lines(diff_content, max_lines):
+        line_content = content.strip()
+
+        # Check for interesting patterns
+        if len(line_content) > 10:
+            lowered = line_content.lower()
+            for pattern, description in INTERESTING_PATTERNS:
+                if pattern in lowered:
+                    comment = f"Inline comment on {description}: This line contains {pattern.strip()}"
+                    return (line_number, line_content, comment)
+
+        # Remember the first meaningful added line as a fallback
+        if first_meaningful is None and len(line_content) > 5 and not line_content.startswith("//"):
+            first_meaningful = (line_number, line_content, "Test inline comment on this line")
+
+    return first_meaningful
+
+
+def select_line(
+    diffs: List[Dict[str, Any]],
+    file_path: Optional[str] = None,
+    line_number: Optional[int] = None,
+    interesting: bool = False
+) -> Optional[Tuple[str, int, Optional[str]]]:
+    """Pick the file and line to comment on.
+
+    An explicit file and line are used as given when the file is part of the
+    diff. Otherwise the candidate files (just file_path, if given) are scanned
+    for the first added line, or the first interesting one.
+
+    Returns: (file_path, line_number, suggested_comment or None)
+    """
+    if file_path and line_number:
+        for diff in diffs:
+            if file_path in (diff.get("new_path"), diff.get("old_path")):
+                return (file_path, line_number, None)
+        print(f"File {file_path} not found in merge request diff")
+        return None
+
+    finder = find_interesting_line if interesting else find_first_added_line
+    for diff in diffs:
+        path = diff.get("new_path")
+        diff_content = diff.get("diff")
+        if not path or not diff_content or (file_path and file_path not in (path, diff.get("old_path"))):
+            continue
+        if "+" not in diff_content or diff_content.startswith("Binary files"):
+            continue
+
+        found = finder(diff_content)
+        if found:
+            found_line, line_content, suggested_comment = found
+            print(f"Found line {found_line} in {path}: {line_content[:80]}")
+            return (path, found_line, suggested_comment)
+
+    return None
+
+
+async def get_merge_request_diff(
+    client: "GitLabClient",
+    project_id: str,
+    mr_iid: str,
+    validator: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Get merge request diffs, from the disk cache while validator matches."""
+    diff_info = await cached_get(client, f"/projects/{project_id}/merge_requests/{mr_iid}/diffs", validator)
+    # Older GitLab versions wrap the list in {"diffs": [...]}
+    if isinstance(diff_info, dict):
+        return diff_info.get("diffs") or []
+    return diff_info or []
+
+
+async def get_merge_request_versions(client: "GitLabClient", project_id: str, mr_iid: str) -> List[Dict[str, Any]]:
+    """Get merge request versions (for getting SHA information)."""
+    return await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}/versions")
+
+
+async def create_inline_comment(
+    client: "GitLabClient",
+    project_id: str,
+    mr_iid: str,
+    file_path: str,
+    line_number: int,
+    comment_text: str,
+    line_type: str = "new",  # "new" or "old"
+    base_sha: Optional[str] = None,
+    start_sha: Optional[str] = None,
+    head_sha: Optional[str] = None
+) -> Dict[str, Any]:
+    """Create an inline comment on a specific line in a merge request.
+
+    Args:
+        client: GitLab client instance
+        project_id: Project ID or URL-encoded path
+        mr_iid: Merge request IID
+        file_path: Path to the file in the diff
+        line_number: Line number to comment on
+        comment_text: Text of the comment
+        line_type: "new" for additions, "old" for deletions
+        base_sha: Base commit SHA (optional, will fetch if not provided)
+        start_sha: Start commit SHA (optional, will fetch if not provided)
+        head_sha: Head commit SHA (optional, will fetch if not provided)
+    """
+
+    # If SHAs not provided, fetch them from MR versions
+    if not all([base_sha, start_sha, head_sha]):
+        versions = await get_merge_request_versions(client, project_id, mr_iid)
+        if versions and len(versions) > 0:
+            latest_version = versions[0]
+            base_sha = base_sha or latest_version.get("base_commit_sha")
+            start_sha = start_sha or latest_version.get("start_commit_sha")
+            head_sha = head_sha or latest_version.get("head_commit_sha")
+
+    # Construct position object for inline comment
+    position = {
+        "base_sha": base_sha,
+        "start_sha": start_sha,
+        "head_sha": head_sha,
+        "position_type": "text"
+    }
+    if line_type == "new":
+        position["new_path"] = file_path
+        position["new_line"] = line_number
+    elif line_type == "old":
+        position["old_path"] = file_path
+        position["old_line"] = line_number
+
+    # Create the discussion with inline comment
+    data = {
+        "body": comment_text,
+        "position": position
+    }
+
+    return await client.post(
+        f"/projects/{project_id}/merge_requests/{mr_iid}/discussions",
+        json_data=data
+    )
+
+
+async def verify_comment(client: "GitLabClient", project_id: str, mr_iid: str, discussion_id: str) -> None:
+    """List the MR's discussions and confirm the new one is among them."""
+    print("\n" + "-" * 60)
+    print("Verifying by fetching discussions...")
+    discussions = await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}/discussions")
+
+    inline_count = 0
+    for discussion in discussions:
+        if discussion.get("notes") and discussion["notes"][0].get("position"):
+            inline_count += 1
+            if discussion["id"] == discussion_id:
+                print(f"✅ Found our comment in discussions (ID: {discussion['id']})")
+
+    print("\nDiscussion Summary:")
+    print(f"  Total discussions: {len(discussions)}")
+    print(f"  Inline discussions: {inline_count}")
+    print(f"  Regular discussions: {len(discussions) - inline_count}")
+
+
+async def test_inline_comment(
+    project_id: str,
+    mr_iid: str,
+    file_path: Optional[str] = None,
+    line_number: Optional[int] = None,
+    comment_text: Optional[str] = None,
+    interesting: bool = False,
+    verify: bool = False
+):
+    """Test creating an inline comment on a merge request."""
+    from mcp_extended_gitlab.client import GitLabClient, GitLabConfig
+
+    config = GitLabConfig(
+        base_url=os.getenv("GITLAB_BASE_URL", "https://gitlab.com/api/v4"),
+        private_token=os.getenv("GITLAB_PRIVATE_TOKEN")
+    )
+
+    async with GitLabClient(config) as client:
+        print(f"Testing inline comment on MR !{mr_iid} in project {project_id}")
+        print("-" * 60)
+
+        try:
+            # MR info is small and tells us whether the cached diff is still valid
+            mr_info = await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}")
+            print(f"Merge Request: {mr_info['title']}")
+            print(f"Author: {mr_info['author']['name']}")
+            print(f"State: {mr_info['state']}")
+            print(f"Web URL: {mr_info['web_url']}")
+            print()
+
+            print("Fetching diff information...")
+            diffs = await get_merge_request_diff(client, project_id, mr_iid, mr_validator(mr_info))
+
+            if not diffs:
+                print("No diffs found in merge request")
+                return
+
+            print(f"Found {len(diffs)} changed files")
+
+            selected = select_line(diffs, file_path, line_number, interesting)
+            if not selected:
+                print("Could not find a suitable file/line to comment on")
+                return
+
+            file_path, line_number, suggested_comment = selected
+
+            # Default comment text if not provided
+            if not comment_text:
+                comment_text = (suggested_comment or f"Test inline comment on line {line_number} of {file_path}") + COMMENT_SUFFIX
+
+            # The MR payload already carries the diff SHAs; create_inline_comment
+            # only falls back to the versions endpoint when they are missing
+            diff_refs = mr_info.get("diff_refs") or {}
+
+            # Create the inline comment
+            print(f"\nCreating inline comment on {file_path}:{line_number}...")
+            print(f"Comment: {comment_text}")
+
+            result = await create_inline_comment(
+                client=client,
+                project_id=project_id,
+                mr_iid=mr_iid,
+                file_path=file_path,
+                line_number=line_number,
+                comment_text=comment_text,
+                line_type="new",  # Commenting on added lines
+                base_sha=diff_refs.get("base_sha"),
+                start_sha=diff_refs.get("start_sha"),
+                head_sha=diff_refs.get("head_sha")
+            )
+
+            print("\n✅ Successfully created inline comment!")
+            print(f"Discussion ID: {result['id']}")
+
+            # Show the created comment details
+            if result.get("notes") and len(result["notes"]) > 0:
+                note = result["notes"][0]
+                print(f"Comment ID: {note['id']}")
+                print(f"Author: {note['author']['name']}")
+                print(f"Created at: {note['created_at']}")
+
+                # Check if it's positioned correctly
+                if note.get("position"):
+                    pos = note["position"]
+                    print(f"Position: Line {pos.get('new_line', pos.get('old_line'))} in {pos.get('new_path', pos.get('old_path'))}")
+
+            # The POST response already identifies the note, so the link needs
+            # no further request; listing discussions is opt-in
+            if result.get("notes"):
+                print(f"\n🔗 View the comment: {mr_info['web_url']}#note_{result['notes'][0]['id']}")
+
+            if verify:
+                await verify_comment(client, project_id, mr_iid, result["id"])
+
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+
+
+async def main(
+    argv: Optional[List[str]] = None,
+    *,
+    description: str = "Test inline comments on GitLab merge requests",
+    interesting: bool = False
+):
+    """Parse the command line and run the test.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        description: Help text for the entry-point script
+        interesting: Prefer lines matching INTERESTING_PATTERNS over the first added line
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("project_id", help="Project ID (e.g., 85)")
+    parser.add_argument("mr_iid", help="Merge request IID (e.g., 4328)")
+    parser.add_argument("--file", "-f", help="File path to comment on")
+    parser.add_argument("--line", "-l", type=int, help="Line number to comment on")
+    parser.add_argument("--comment", "-c", help="Comment text")
+    parser.add_argument("--verify", action="store_true",
+                       help="List the MR's discussions afterwards to confirm the new comment")
+
+    args = parser.parse_args(argv)
+
+    # Check for GitLab token
+    if not os.getenv("GITLAB_PRIVATE_TOKEN"):
+        print("Error: GITLAB_PRIVATE_TOKEN environment variable is required")
+        print("Set it with: export GITLAB_PRIVATE_TOKEN='your-token'")
+        sys.exit(1)
+
+    await test_inline_comment(
+        project_id=args.project_id,
+        mr_iid=args.mr_iid,
+        file_path=args.file,
+        line_number=args.line,
+        comment_text=args.comment,
+        interesting=interesting,
+        verify=args.verify
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
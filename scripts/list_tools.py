@@ -5,30 +5,14 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from mcp_extended_gitlab.tool_registry import MODULE_REGISTRY, TOOL_PRESETS
-from importlib import import_module
-import inspect
+from mcp_extended_gitlab.tool_registry import TOOL_PRESETS, get_tools_by_category
 
 def get_all_tools():
-    """Get all tool names from all modules."""
-    tools_by_category = {}
-    
-    for category, modules in MODULE_REGISTRY.items():
-        tools_by_category[category] = []
-        
-        for module_name in modules:
-            try:
-                # Import the module
-                module = import_module(f"mcp_extended_gitlab.api.{category}.{module_name}")
-                
-                # Find all functions decorated with @mcp.tool()
-                for name, obj in inspect.getmembers(module):
-                    if inspect.iscoroutinefunction(obj) and not name.startswith('_') and name != 'get_gitlab_client' and name != 'register':
-                        tools_by_category[category].append(name)
-            except Exception as e:
-                print(f"Error loading {category}.{module_name}: {e}", file=sys.stderr)
-    
-    return tools_by_category
+    """Get all tool names grouped by category.
+
+    API modules are imported lazily by the registry, only when this is called.
+    """
+    return get_tools_by_category()
 
 def main():
     print("# MCP Extended GitLab - Available Tools\n")
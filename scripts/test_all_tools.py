@@ -14,12 +14,19 @@ import json
 import os
 import sys
 import time
+import importlib.util
 import inspect
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Callable, Dict, Any, List, Optional, Tuple, Set
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
 from collections import defaultdict
+from weakref import WeakKeyDictionary
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "mcp-extended-gitlab[fast]"
+    orjson = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,10 +36,25 @@ from mcp_extended_gitlab.tool_registry import (
     MODULE_REGISTRY, 
     build_tool_to_module_map,
     get_tools_by_category,
+    TOOL_PRESET_ORDER,
     TOOL_PRESETS
 )
 from mcp_extended_gitlab.server import mcp
 from fastmcp import FastMCP
+from pydantic import validate_call
+from pydantic.fields import FieldInfo
+
+
+# Parameters naming existing resources, which the tester cannot invent values for
+_ID_PARAM_NAMES = frozenset({"id", "iid"})
+_ID_PARAM_SUFFIXES = ("_id", "_iid", "_ids")
+
+# Tools that only read are tested by default; anything else can change or delete
+# data in the test project and must be enabled with --allow-writes
+_READ_ONLY_PREFIXES = ("get_", "list_", "search_")
+
+# Signature and extracted parameters per tool function, computed once per process
+_SIGNATURE_CACHE: "WeakKeyDictionary[Callable[..., Any], Tuple[inspect.Signature, Dict[str, Dict[str, Any]]]]" = WeakKeyDictionary()
 
 
 @dataclass
@@ -60,21 +82,41 @@ class TestSummary:
     errors: List[Tuple[str, str]] = field(default_factory=list)
     duration: float = 0.0
     results_by_category: Dict[str, List[ToolTestResult]] = field(default_factory=lambda: defaultdict(list))
+    # (passed, failed, skipped) per category, kept up to date as results are recorded
+    category_counts: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
 
 
 class ToolTester:
     """Test runner for GitLab API tools."""
     
-    def __init__(self, config: Optional[GitLabConfig] = None):
-        """Initialize the tool tester."""
+    def __init__(self, config: Optional[GitLabConfig] = None, keep_responses: bool = False,
+                 allow_writes: bool = False):
+        """Initialize the tool tester.
+
+        API responses are dropped after each call unless keep_responses is set,
+        in which case the JSON report includes them. Tools that may modify data are skipped
+        unless allow_writes is set.
+        """
         self.config = config or GitLabConfig(
             base_url=os.getenv("GITLAB_BASE_URL", "https://gitlab.com/api/v4"),
-            private_token=os.getenv("GITLAB_PRIVATE_TOKEN")
+            private_token=os.getenv("GITLAB_PRIVATE_TOKEN"),
+            # Multiplex concurrent tool calls over one connection when h2 is installed
+            http2=importlib.util.find_spec("h2") is not None
         )
         self.client = GitLabClient(self.config)
         self.test_project_id = os.getenv("GITLAB_TEST_PROJECT_ID")
         self.test_group_id = os.getenv("GITLAB_TEST_GROUP_ID")
         self.test_user_id = os.getenv("GITLAB_TEST_USER_ID")
+        self.keep_responses = keep_responses
+        self.allow_writes = allow_writes
+        # Test resource ID and skip reason for each resource ID parameter
+        self._resource_ids = {
+            "project_id": (self.test_project_id, "No test project ID configured"),
+            "group_id": (self.test_group_id, "No test group ID configured"),
+            "user_id": (self.test_user_id, "No test user ID configured"),
+        }
+        # Discovered tools; the registered tool set does not change during a run
+        self._tools: Optional[Dict[str, Dict[str, Any]]] = None
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -85,38 +127,53 @@ class ToolTester:
         await self.client.close()
     
     def get_all_tools(self) -> Dict[str, Dict[str, Any]]:
-        """Discover all registered tools from the MCP server."""
+        """Discover all registered tools from the MCP server.
+
+        Discovery runs once per tester; later calls return the same mapping.
+        """
+        if self._tools is not None:
+            return self._tools
+        
         tools = {}
         
         # Get tool to module mapping
         tool_to_module = build_tool_to_module_map()
-        tools_by_category = get_tools_by_category()
+        tool_to_category = {
+            tool: category
+            for category, tool_list in get_tools_by_category().items()
+            for tool in tool_list
+        }
         
-        # Extract tools from the MCP server
-        for tool_name in mcp._tools.keys():
+        # Extract tools from the MCP server, once each under their original name
+        for tool in mcp._mcp._tool_manager._tools.values():
+            tool_func = tool.fn
+            tool_name = getattr(tool_func, "_orig_name", tool.name)
             module_name = tool_to_module.get(tool_name, "unknown")
+            category = tool_to_category.get(tool_name, "unknown")
             
-            # Determine category
-            category = "unknown"
-            for cat, tool_list in tools_by_category.items():
-                if tool_name in tool_list:
-                    category = cat
-                    break
-            
-            # Get tool function and parameters
-            tool_func = mcp._tools[tool_name]
-            sig = inspect.signature(tool_func)
+            # Get tool parameters
+            cached = _SIGNATURE_CACHE.get(tool_func)
+            if cached is None:
+                sig = inspect.signature(tool_func)
+                cached = _SIGNATURE_CACHE[tool_func] = (sig, self._extract_parameters(sig))
+            sig, parameters = cached
             
             tools[tool_name] = {
                 "module": module_name,
                 "category": category,
-                "function": tool_func,
+                # validate_call resolves Field defaults for omitted arguments, as MCP does
+                "function": validate_call(tool_func),
                 "signature": sig,
-                "parameters": self._extract_parameters(sig)
+                "parameters": parameters
             }
-            
+        
+        self._tools = tools
         return tools
     
+    def get_tool(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        """Return the discovered info for one tool, or None if it is not registered."""
+        return self.get_all_tools().get(tool_name)
+    
     def _extract_parameters(self, sig: inspect.Signature) -> Dict[str, Dict[str, Any]]:
         """Extract parameter information from function signature."""
         params = {}
@@ -125,8 +182,14 @@ class ToolTester:
             if name in ["self", "cls"]:
                 continue
                 
+            # Tool parameters default to pydantic Field(...), which may itself be required
+            if isinstance(param.default, FieldInfo):
+                required = param.default.is_required()
+            else:
+                required = param.default == inspect.Parameter.empty
+            
             param_info = {
-                "required": param.default == inspect.Parameter.empty,
+                "required": required,
                 "type": str(param.annotation) if param.annotation != inspect.Parameter.empty else "Any"
             }
             
@@ -146,24 +209,16 @@ class ToolTester:
         params = {}
         skip_reason = None
         
+        if not self.allow_writes and not tool_name.startswith(_READ_ONLY_PREFIXES):
+            return params, "May modify data (use --allow-writes to test)"
+        
         # Handle tools that require specific resources
-        if "project_id" in parameters and parameters["project_id"]["required"]:
-            if not self.test_project_id:
-                skip_reason = "No test project ID configured"
-                return params, skip_reason
-            params["project_id"] = self.test_project_id
-            
-        if "group_id" in parameters and parameters["group_id"]["required"]:
-            if not self.test_group_id:
-                skip_reason = "No test group ID configured"
-                return params, skip_reason
-            params["group_id"] = self.test_group_id
-            
-        if "user_id" in parameters and parameters["user_id"]["required"]:
-            if not self.test_user_id:
-                skip_reason = "No test user ID configured"
-                return params, skip_reason
-            params["user_id"] = self.test_user_id
+        for param_name, (resource_id, missing_reason) in self._resource_ids.items():
+            param_info = parameters.get(param_name)
+            if param_info and param_info["required"]:
+                if not resource_id:
+                    return params, missing_reason
+                params[param_name] = resource_id
         
         # Handle other required parameters with sensible defaults
         for param_name, param_info in parameters.items():
@@ -172,7 +227,8 @@ class ToolTester:
                 
             if param_info["required"]:
                 # Provide sensible defaults based on parameter name/type
-                if "id" in param_name and param_name not in ["project_id", "group_id", "user_id"]:
+                # Resource ID parameters were filled above, so any other ID cannot be provided
+                if param_name in _ID_PARAM_NAMES or param_name.endswith(_ID_PARAM_SUFFIXES):
                     skip_reason = f"Cannot provide test value for required parameter: {param_name}"
                     return params, skip_reason
                 elif param_name in ["name", "title", "description"]:
@@ -193,8 +249,8 @@ class ToolTester:
                 elif param_info["type"] == "int":
                     params[param_name] = 1
         
-        # Add pagination limits for list operations
-        if tool_name.startswith("list_") or tool_name.startswith("search_"):
+        # Add pagination limits for list operations that accept them
+        if tool_name.startswith(("list_", "search_")) and "per_page" in parameters:
             params["per_page"] = 5
             params["page"] = 1
             
@@ -229,7 +285,7 @@ class ToolTester:
                 category=tool_info["category"],
                 success=True,
                 duration=duration,
-                response=result,
+                response=result if self.keep_responses else None,
                 params_used=params
             )
             
@@ -252,9 +308,10 @@ class ToolTester:
         categories: Optional[List[str]] = None,
         preset: Optional[str] = None,
         stop_on_error: bool = False,
-        verbose: bool = False
+        verbose: bool = False,
+        concurrency: int = 16
     ) -> TestSummary:
-        """Test multiple tools based on filters."""
+        """Test multiple tools based on filters, up to `concurrency` at a time."""
         # Discover all tools
         all_tools = self.get_all_tools()
         
@@ -263,35 +320,59 @@ class ToolTester:
         
         # Initialize summary
         summary = TestSummary(total_tools=len(all_tools))
+        # Categories are known up front, so create their result lists once
+        summary.results_by_category = {info["category"]: [] for info in tools_to_test.values()}
         start_time = time.time()
         
-        # Test each tool
-        for tool_name, tool_info in tools_to_test.items():
-            if verbose:
-                click.echo(f"Testing {tool_name}...", nl=False)
-            
-            result = await self.test_tool(tool_name, tool_info)
-            
-            # Update summary
-            summary.tested += 1
-            summary.results_by_category[result.category].append(result)
-            
-            if result.skip_reason:
-                summary.skipped += 1
-                if verbose:
-                    click.echo(f" SKIPPED ({result.skip_reason})")
-            elif result.success:
-                summary.passed += 1
-                if verbose:
-                    click.echo(f" ✓ ({result.duration:.2f}s)")
-            else:
-                summary.failed += 1
-                summary.errors.append((tool_name, result.error or "Unknown error"))
+        # Test tools concurrently; the API calls are I/O-bound and share one client
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_one(tool_name: str, tool_info: Dict[str, Any]) -> ToolTestResult:
+            async with semaphore:
+                return await self.test_tool(tool_name, tool_info)
+        
+        tasks = [asyncio.create_task(run_one(name, info)) for name, info in tools_to_test.items()]
+        # Progress lines are buffered and flushed in batches rather than per tool
+        stdout = sys.stdout
+        try:
+            # Update the summary as results complete
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                
+                summary.tested += 1
+                summary.results_by_category[result.category].append(result)
+                passed, failed, skipped = summary.category_counts.get(result.category, (0, 0, 0))
+                
+                if result.skip_reason:
+                    summary.skipped += 1
+                    skipped += 1
+                    status = f"SKIPPED ({result.skip_reason})"
+                elif result.success:
+                    summary.passed += 1
+                    passed += 1
+                    status = f"✓ ({result.duration:.2f}s)"
+                else:
+                    summary.failed += 1
+                    failed += 1
+                    summary.errors.append((result.tool_name, result.error or "Unknown error"))
+                    status = f"✗ ({result.error})"
+                
+                summary.category_counts[result.category] = (passed, failed, skipped)
+                
                 if verbose:
-                    click.echo(f" ✗ ({result.error})")
+                    stdout.write(f"Testing {result.tool_name}... {status}\n")
+                    if summary.tested % 32 == 0:
+                        stdout.flush()
                 
-                if stop_on_error:
+                if stop_on_error and summary.failed:
                     break
+        finally:
+            # Cancel tools still pending after stop_on_error, and wait for them to
+            # unwind before the caller closes the client they are using
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            stdout.flush()
         
         summary.duration = time.time() - start_time
         return summary
@@ -304,20 +385,18 @@ class ToolTester:
         preset: Optional[str]
     ) -> Dict[str, Dict[str, Any]]:
         """Filter tools based on criteria."""
+        # Look up the (usually few) requested names rather than scanning all tools
         if preset and preset in TOOL_PRESETS:
-            # Use preset tool list
-            preset_tools = set(TOOL_PRESETS[preset])
-            return {k: v for k, v in all_tools.items() if k in preset_tools}
+            return {k: all_tools[k] for k in TOOL_PRESET_ORDER[preset] if k in all_tools}
         
         filtered = all_tools
         
         if tools_filter:
-            # Filter by specific tool names
-            filtered = {k: v for k, v in filtered.items() if k in tools_filter}
+            filtered = {k: filtered[k] for k in tools_filter if k in filtered}
             
         if categories:
-            # Filter by categories
-            filtered = {k: v for k, v in filtered.items() if v["category"] in categories}
+            category_set = set(categories)
+            filtered = {k: v for k, v in filtered.items() if v["category"] in category_set}
             
         return filtered
     
@@ -351,10 +430,7 @@ class ToolTester:
         
         # Results by category
         lines.append("Results by Category:")
-        for category, results in sorted(summary.results_by_category.items()):
-            passed = sum(1 for r in results if r.success and not r.skip_reason)
-            failed = sum(1 for r in results if not r.success and not r.skip_reason)
-            skipped = sum(1 for r in results if r.skip_reason)
+        for category, (passed, failed, skipped) in sorted(summary.category_counts.items()):
             lines.append(f"  {category}: {passed} passed, {failed} failed, {skipped} skipped")
         lines.append("")
         
@@ -405,9 +481,7 @@ class ToolTester:
         
         # Add category summaries and detailed results
         for category, results in summary.results_by_category.items():
-            passed = sum(1 for r in results if r.success and not r.skip_reason)
-            failed = sum(1 for r in results if not r.success and not r.skip_reason)
-            skipped = sum(1 for r in results if r.skip_reason)
+            passed, failed, skipped = summary.category_counts.get(category, (0, 0, 0))
             
             report["categories"][category] = {
                 "tested": len(results),
@@ -417,7 +491,7 @@ class ToolTester:
             }
             
             for result in results:
-                report["results"].append({
+                entry = {
                     "tool": result.tool_name,
                     "module": result.module,
                     "category": result.category,
@@ -426,8 +500,13 @@ class ToolTester:
                     "error": result.error,
                     "skip_reason": result.skip_reason,
                     "params_used": result.params_used
-                })
+                }
+                if self.keep_responses:
+                    entry["response"] = result.response
+                report["results"].append(entry)
         
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(report, indent=2)
     
     def _generate_markdown_report(self, summary: TestSummary) -> str:
@@ -457,11 +536,8 @@ class ToolTester:
         lines.append("| Category | Tested | Passed | Failed | Skipped |")
         lines.append("|----------|--------|--------|--------|---------|")
         
-        for category, results in sorted(summary.results_by_category.items()):
-            passed = sum(1 for r in results if r.success and not r.skip_reason)
-            failed = sum(1 for r in results if not r.success and not r.skip_reason)
-            skipped = sum(1 for r in results if r.skip_reason)
-            lines.append(f"| {category} | {len(results)} | {passed} | {failed} | {skipped} |")
+        for category, (passed, failed, skipped) in sorted(summary.category_counts.items()):
+            lines.append(f"| {category} | {passed + failed + skipped} | {passed} | {failed} | {skipped} |")
         
         lines.append("")
         
@@ -492,14 +568,20 @@ class ToolTester:
 @click.option("--output", "-o", type=click.Path(), help="Save report to file")
 @click.option("--stop-on-error", is_flag=True, help="Stop testing on first error")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
+@click.option("--allow-writes", is_flag=True,
+              help="Also test tools that may create, change or delete data (get_/list_/search_ tools only by default)")
+@click.option("--keep-responses", is_flag=True,
+              help="Keep each tool's API response and include it in the JSON report")
+@click.option("--concurrency", "-j", type=click.IntRange(min=1), default=16, show_default=True,
+              help="Maximum number of tools tested at once")
 @click.option("--test-project", envvar="GITLAB_TEST_PROJECT_ID", 
               help="GitLab project ID for testing")
 @click.option("--test-group", envvar="GITLAB_TEST_GROUP_ID",
               help="GitLab group ID for testing")
 @click.option("--test-user", envvar="GITLAB_TEST_USER_ID",
               help="GitLab user ID for testing")
-def test_tools(tools, category, preset, format, output, stop_on_error, verbose,
-               test_project, test_group, test_user):
+def test_tools(tools, category, preset, format, output, stop_on_error, verbose, allow_writes, keep_responses,
+               concurrency, test_project, test_group, test_user):
     """Test GitLab API tools with various options.
     
     Examples:
@@ -520,6 +602,9 @@ def test_tools(tools, category, preset, format, output, stop_on_error, verbose,
         
         # Test with specific project/group/user
         python test_all_tools.py --test-project 123 --test-group 456
+        
+        # Also run tools that create, change or delete data (use a throwaway project!)
+        python test_all_tools.py --test-project 123 --allow-writes
     """
     
     # Check for GitLab token
@@ -537,13 +622,14 @@ def test_tools(tools, category, preset, format, output, stop_on_error, verbose,
     
     # Run tests
     async def run():
-        async with ToolTester() as tester:
+        async with ToolTester(keep_responses=keep_responses, allow_writes=allow_writes) as tester:
             summary = await tester.test_tools(
                 tools_filter=list(tools) if tools else None,
                 categories=list(category) if category else None,
                 preset=preset,
                 stop_on_error=stop_on_error,
-                verbose=verbose
+                verbose=verbose,
+                concurrency=concurrency
             )
             
             # Generate report
@@ -551,7 +637,7 @@ def test_tools(tools, category, preset, format, output, stop_on_error, verbose,
             
             # Output report
             if output:
-                Path(output).write_text(report)
+                Path(output).write_text(report, encoding="utf-8")
                 click.echo(f"Report saved to {output}")
             else:
                 click.echo(report)
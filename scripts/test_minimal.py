@@ -22,7 +22,7 @@ async def test_minimal_tools():
     print("Testing minimal GitLab API tools...")
     print("-" * 50)
     
-    async with ToolTester() as tester:
+    async with ToolTester(keep_responses=True) as tester:
         # Test a few basic tools that don't require specific resources
         basic_tools = [
             "get_current_user",  # Should always work
@@ -31,21 +31,26 @@ async def test_minimal_tools():
             "search_globally"    # Search with a simple query
         ]
         
+        all_tools = tester.get_all_tools()
         for tool_name in basic_tools:
-            print(f"\nTesting {tool_name}...")
-            
-            # Get tool info
-            all_tools = tester.get_all_tools()
             if tool_name not in all_tools:
+                print(f"\nTesting {tool_name}...")
                 print(f"  ERROR: Tool '{tool_name}' not found!")
-                continue
-                
-            tool_info = all_tools[tool_name]
-            
-            # Test the tool
-            result = await tester.test_tool(tool_name, tool_info)
+        
+        # The tools are independent read-only calls, so run them concurrently
+        # and report once they have all finished
+        found = [name for name in basic_tools if name in all_tools]
+        results = await asyncio.gather(
+            *(tester.test_tool(name, all_tools[name]) for name in found),
+            return_exceptions=True
+        )
+        
+        for tool_name, result in zip(found, results):
+            print(f"\nTesting {tool_name}...")
             
-            if result.skip_reason:
+            if isinstance(result, Exception):
+                print(f"  FAILED: {result}")
+            elif result.skip_reason:
                 print(f"  SKIPPED: {result.skip_reason}")
             elif result.success:
                 print(f"  SUCCESS: Completed in {result.duration:.2f}s")
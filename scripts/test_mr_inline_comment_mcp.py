@@ -10,6 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scripts.inline_comment import find_first_added_line
 from scripts.test_all_tools import ToolTester
 
 
@@ -20,9 +21,6 @@ async def test_mr_inline_comment(project_id: str = "85", mr_iid: str = "4328"):
     print("=" * 60)
     
     async with ToolTester() as tester:
-        # Get all tools
-        all_tools = tester.get_all_tools()
-        
         # First, get MR diff to find files and lines
         print("\n1. Getting merge request diff...")
         
@@ -31,14 +29,17 @@ async def test_mr_inline_comment(project_id: str = "85", mr_iid: str = "4328"):
         client = tester.client
         
         try:
-            # Get MR info
-            mr_info = await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}")
+            # MR info and diffs are independent, so fetch them together
+            mr_path = f"/projects/{project_id}/merge_requests/{mr_iid}"
+            mr_info, diff_info = await asyncio.gather(
+                client.get(mr_path),
+                client.get(f"{mr_path}/diffs")
+            )
             print(f"   MR Title: {mr_info['title']}")
             print(f"   Author: {mr_info['author']['name']}")
             
-            # Get diffs
-            diff_info = await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}/diffs")
-            diffs = diff_info.get("diffs", [])
+            # /diffs returns a list; older GitLab versions wrap it in {"diffs": [...]}
+            diffs = diff_info.get("diffs", []) if isinstance(diff_info, dict) else diff_info
             
             if not diffs:
                 print("   No diffs found!")
@@ -51,50 +52,42 @@ async def test_mr_inline_comment(project_id: str = "85", mr_iid: str = "4328"):
             target_line = None
             
             for diff in diffs:
-                if diff.get("added_lines", 0) > 0:
-                    target_file = diff["new_path"]
-                    
-                    # Parse diff to find first added line
-                    if diff.get("diff"):
-                        lines = diff["diff"].split('\n')
-                        current_line = 0
-                        
-                        for line in lines:
-                            if line.startswith("@@"):
-                                # Extract line number from diff header
-                                import re
-                                match = re.search(r'\+(\d+)', line)
-                                if match:
-                                    current_line = int(match.group(1)) - 1
-                            elif line.startswith("+") and not line.startswith("+++"):
-                                current_line += 1
-                                target_line = current_line
-                                print(f"\n   Target file: {target_file}")
-                                print(f"   Target line: {target_line}")
-                                print(f"   Line content: {line[1:].strip()[:60]}...")
-                                break
-                            elif not line.startswith("-"):
-                                current_line += 1
-                        
-                        if target_line:
-                            break
+                # /diffs entries carry no added-line counts, so look for one in the text
+                if diff.get("diff") and diff.get("new_path"):
+                    found = find_first_added_line(diff["diff"])
+                    if found:
+                        target_file = diff["new_path"]
+                        target_line, line_content, _ = found
+                        print(f"\n   Target file: {target_file}")
+                        print(f"   Target line: {target_line}")
+                        print(f"   Line content: {line_content[:60]}...")
+                        break
             
             if not target_file or not target_line:
                 print("   Could not find suitable file/line for comment")
                 return
             
-            # Get MR versions for SHA information
-            print("\n2. Getting merge request versions for SHA info...")
-            versions = await client.get(f"/projects/{project_id}/merge_requests/{mr_iid}/versions")
-            
-            if not versions or len(versions) == 0:
-                print("   No versions found!")
-                return
+            # The MR payload already carries the diff SHAs; only fall back to the
+            # versions endpoint when GitLab has not computed them yet
+            refs = mr_info.get("diff_refs") or {}
+            base_sha = refs.get("base_sha")
+            start_sha = refs.get("start_sha")
+            head_sha = refs.get("head_sha")
             
-            latest_version = versions[0]
-            base_sha = latest_version.get("base_commit_sha")
-            start_sha = latest_version.get("start_commit_sha") 
-            head_sha = latest_version.get("head_commit_sha")
+            if not all([base_sha, start_sha, head_sha]):
+                print("\n2. Getting merge request versions for SHA info...")
+                versions = await client.get(f"{mr_path}/versions")
+                
+                if not versions or len(versions) == 0:
+                    print("   No versions found!")
+                    return
+                
+                latest_version = versions[0]
+                base_sha = latest_version.get("base_commit_sha")
+                start_sha = latest_version.get("start_commit_sha")
+                head_sha = latest_version.get("head_commit_sha")
+            else:
+                print("\n2. Using the merge request's diff_refs for SHA info...")
             
             print(f"   Base SHA: {base_sha[:8]}...")
             print(f"   Head SHA: {head_sha[:8]}...")
@@ -114,8 +107,8 @@ async def test_mr_inline_comment(project_id: str = "85", mr_iid: str = "4328"):
             # Now use the MCP tool to create inline comment
             print("\n3. Creating inline comment using MCP tool...")
             
-            if "create_new_merge_request_thread" in all_tools:
-                tool_info = all_tools["create_new_merge_request_thread"]
+            tool_info = tester.get_tool("create_merge_request_thread")
+            if tool_info:
                 
                 # Prepare parameters
                 params = {
@@ -142,7 +135,7 @@ async def test_mr_inline_comment(project_id: str = "85", mr_iid: str = "4328"):
                         pos = note["position"]
                         print(f"   Position confirmed: Line {pos.get('new_line')} in {pos.get('new_path')}")
             else:
-                print("   ERROR: create_new_merge_request_thread tool not found!")
+                print("   ERROR: create_merge_request_thread tool not found!")
                 
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -1,103 +1,85 @@
 #!/usr/bin/env python3
 """Test creating multi-line inline comments on GitLab merge requests."""
 
+import asyncio
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
-import ssl
+import os
 import sys
 import argparse
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def make_api_request(url: str, token: str, method: str = "GET", data: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make an API request to GitLab."""
-    headers = {
-        "Private-Token": token,
-        "Content-Type": "application/json"
-    }
-    
-    # Create SSL context that doesn't verify certificates (for self-signed certs)
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    request = urllib.request.Request(url, headers=headers, method=method)
-    
-    if data and method in ["POST", "PUT"]:
-        request.data = json.dumps(data).encode('utf-8')
-    
-    try:
-        with urllib.request.urlopen(request, context=ssl_context) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        print(f"API Error {e.code}: {error_body}")
-        raise
-
+import httpx
 
-def get_mr_versions(base_url: str, token: str, project_id: str, mr_iid: str) -> Dict[str, Any]:
-    """Get merge request versions to obtain SHA information."""
-    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/versions"
-    versions = make_api_request(url, token)
-    return versions[0] if versions else {}
+from scripts._gitlab_api import get_mr_diffs, get_mr_versions, json_dumps, json_loads, make_api_request
+from scripts._gitlab_cache import cached_call, mr_validator
+from scripts.inline_comment import HUNK_RE, iter_diff_lines
 
 
-def get_mr_diffs(base_url: str, token: str, project_id: str, mr_iid: str) -> Dict[str, Any]:
-    """Get merge request diff information."""
-    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/diffs"
-    return make_api_request(url, token)
+def count_diff_lines(diff_text: str, marker: str) -> int:
+    """Count the diff lines starting with marker ("+" or "-")."""
+    return diff_text.count(f"\n{marker}") + diff_text.startswith(marker)
 
 
 def find_line_range(diff_text: str, start_line: int = 1, num_lines: int = 5) -> Tuple[int, int]:
-    """Find a suitable line range in the diff for multi-line comment."""
-    lines = diff_text.split('\n')
+    """Find a suitable line range in the diff for multi-line comment.
+    
+    Added line numbers only grow through a diff, so the scan stops as soon as
+    the range is known and keeps at most num_lines of them.
+    """
     current_line = 0
-    added_lines = []
+    first_added = []  # The first num_lines added lines
+    from_start = 0  # Added lines seen since start_line, once it was found
+    last_added = 0
     
-    for line in lines:
-        if line.startswith("@@"):
+    for line in iter_diff_lines(diff_text):
+        c = line[:1]
+        if c == "@" and line.startswith("@@"):
             # Parse line numbers from diff header
-            import re
-            match = re.search(r'\+(\d+)', line)
+            match = HUNK_RE.search(line)
             if match:
                 current_line = int(match.group(1)) - 1
-        elif line.startswith("+") and not line.startswith("+++"):
+        elif c == "+" and not line.startswith("+++"):
             current_line += 1
-            added_lines.append(current_line)
-        elif not line.startswith("-"):
+            last_added = current_line
+            if len(first_added) < num_lines:
+                first_added.append(current_line)
+            
+            if current_line == start_line or from_start:
+                from_start += 1
+                # Enough lines from the requested start line
+                if from_start == num_lines:
+                    return start_line, current_line
+            elif current_line > start_line and len(first_added) == num_lines:
+                # The requested start line is not an added line; use the first range
+                return first_added[0], first_added[-1]
+        elif c != "-":
             current_line += 1
     
-    # Find a range of consecutive added lines
-    if len(added_lines) >= num_lines:
-        # Try to find the requested start line
-        if start_line in added_lines:
-            idx = added_lines.index(start_line)
-            end_idx = min(idx + num_lines - 1, len(added_lines) - 1)
-            return start_line, added_lines[end_idx]
-        else:
-            # Use first available range
-            return added_lines[0], added_lines[num_lines - 1]
-    elif added_lines:
+    if from_start and len(first_added) == num_lines:
+        # The requested start line was found but fewer lines follow it
+        return start_line, last_added
+    elif len(first_added) == num_lines:
+        return first_added[0], first_added[-1]
+    elif first_added:
         # Use whatever lines we have
-        return added_lines[0], added_lines[-1]
+        return first_added[0], last_added
     
     return 0, 0
 
 
-def create_multiline_comment(
-    base_url: str,
-    token: str,
-    project_id: str,
-    mr_iid: str,
+def build_multiline_discussion(
     file_path: str,
     start_line: int,
     end_line: int,
     comment_text: str,
     version_info: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Create a multi-line inline comment."""
+    """Build the discussion payload for a multi-line inline comment."""
     
     # Construct position object for multi-line comment
     position = {
@@ -121,15 +103,105 @@ def create_multiline_comment(
         }
     }
     
-    data = {
+    return {
         "body": comment_text,
         "position": position
     }
-    
+
+
+def create_multiline_comment(
+    base_url: str,
+    token: str,
+    project_id: str,
+    mr_iid: str,
+    file_path: str,
+    start_line: int,
+    end_line: int,
+    comment_text: str,
+    version_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create a multi-line inline comment."""
+    data = build_multiline_discussion(file_path, start_line, end_line, comment_text, version_info)
     url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/discussions"
     return make_api_request(url, token, "POST", data)
 
 
+async def create_multiline_comment_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    target: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create one multi-line inline comment described by a create_many target."""
+    data = build_multiline_discussion(
+        target["file_path"],
+        target["start_line"],
+        target["end_line"],
+        target["comment_text"],
+        target["version_info"]
+    )
+    url = f"{base_url}/projects/{target['project_id']}/merge_requests/{target['mr_iid']}/discussions"
+    response = await client.post(url, content=json_dumps(data))
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+async def create_many(
+    base_url: str,
+    token: str,
+    targets: List[Dict[str, Any]],
+    concurrency: int = 8
+) -> List[Any]:
+    """Create many multi-line comments concurrently, e.g. for soak tests across MRs.
+    
+    Each target holds the create_multiline_comment arguments other than
+    base_url and token. At most `concurrency` requests are in flight, to stay
+    inside GitLab's rate limits. Results are returned in target order, with
+    failures returned as exceptions.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = {"Private-Token": token, "Content-Type": "application/json"}
+    
+    async with httpx.AsyncClient(verify=False, timeout=30, headers=headers) as client:
+        async def create(target: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await create_multiline_comment_async(client, base_url, target)
+        
+        return await asyncio.gather(*(create(t) for t in targets), return_exceptions=True)
+
+
+def create_from_targets_file(args, version_info: Dict[str, Any]) -> None:
+    """Create one comment per entry of the --targets file on the MR."""
+    with open(args.targets) as f:
+        entries = json.load(f)
+    
+    targets = [
+        {
+            "project_id": args.project_id,
+            "mr_iid": args.mr_iid,
+            "file_path": entry["file"],
+            "start_line": entry["start_line"],
+            "end_line": entry["end_line"],
+            "comment_text": entry.get("comment", args.comment),
+            "version_info": version_info
+        }
+        for entry in entries
+    ]
+    print(f"\nCreating {len(targets)} multi-line comments, {args.concurrency} at a time...")
+    results = asyncio.run(create_many(args.base_url, args.token, targets, args.concurrency))
+    
+    failed = 0
+    for target, result in zip(targets, results):
+        location = f"{target['file_path']}:{target['start_line']}-{target['end_line']}"
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"  ❌ {location}: {result}")
+        else:
+            print(f"  ✅ {location}: discussion {result['id']}")
+    print(f"\nCreated {len(targets) - failed}/{len(targets)} comments")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Test multi-line inline comments on GitLab MR")
     parser.add_argument("project_id", help="Project ID")
@@ -141,6 +213,12 @@ def main():
     parser.add_argument("--comment", default="Multi-line test comment from MCP Extended GitLab", help="Comment text")
     parser.add_argument("--token", default=os.getenv("GITLAB_PRIVATE_TOKEN", ""), help="GitLab token")
     parser.add_argument("--base-url", default=os.getenv("GITLAB_BASE_URL", "https://gitlab.com/api/v4"), help="GitLab API base URL")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=True,
+                       help="Reuse diffs/versions cached on disk while the MR's commits are unchanged (default: on)")
+    parser.add_argument("--targets", help='JSON file with a list of {"file", "start_line", "end_line", "comment"} '
+                       "entries; creates one comment per entry instead of picking a line range")
+    parser.add_argument("--concurrency", type=int, default=8,
+                       help="Maximum --targets comments created at once (default: 8)")
     
     args = parser.parse_args()
     
@@ -148,25 +226,54 @@ def main():
     print("=" * 60)
     
     try:
-        # Get MR info
         mr_url = f"{args.base_url}/projects/{args.project_id}/merge_requests/{args.mr_iid}"
-        mr_info = make_api_request(mr_url, args.token)
+        if args.cache:
+            # MR info is small and tells us whether the cached diffs are still valid
+            mr_info = make_api_request(mr_url, args.token)
+            validator = mr_validator(mr_info)
+            diffs = cached_call(
+                lambda: get_mr_diffs(args.base_url, args.token, args.project_id, args.mr_iid),
+                f"{mr_url}/diffs",
+                validator
+            )
+        else:
+            # MR info and diffs are independent GETs, so overlap them on two pooled
+            # connections instead of waiting for one response before sending the next
+            validator = None
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                mr_future = pool.submit(make_api_request, mr_url, args.token)
+                diffs_future = pool.submit(get_mr_diffs, args.base_url, args.token, args.project_id, args.mr_iid)
+                mr_info = mr_future.result()
+                diffs = diffs_future.result()
         print(f"MR Title: {mr_info['title']}")
         print(f"Author: {mr_info['author']['name']}")
         print()
         
-        # Get version info
-        print("Getting version information...")
-        version_info = get_mr_versions(args.base_url, args.token, args.project_id, args.mr_iid)
+        # The MR payload already carries the diff SHAs; only ask the versions
+        # endpoint when GitLab has not computed them yet
+        refs = mr_info.get("diff_refs") or {}
+        if all(refs.get(key) for key in ("base_sha", "start_sha", "head_sha")):
+            version_info = {
+                "base_commit_sha": refs["base_sha"],
+                "start_commit_sha": refs["start_sha"],
+                "head_commit_sha": refs["head_sha"]
+            }
+        else:
+            print("Getting version information...")
+            version_info = cached_call(
+                lambda: get_mr_versions(args.base_url, args.token, args.project_id, args.mr_iid),
+                f"{mr_url}/versions",
+                validator
+            )
         if not version_info:
             print("Error: Could not get version information")
             return
         
         print(f"Head SHA: {version_info['head_commit_sha'][:8]}...")
         
-        # Get diffs
-        print("\nGetting diff information...")
-        diffs = get_mr_diffs(args.base_url, args.token, args.project_id, args.mr_iid)
+        if args.targets:
+            create_from_targets_file(args, version_info)
+            return
         
         if not diffs:
             print("No diffs found!")
@@ -174,38 +281,44 @@ def main():
         
         print(f"Found {len(diffs)} changed files")
         
-        # Select file
-        target_file = args.file
-        if not target_file:
+        # Select the file diff in a single pass over the diffs
+        file_diff = None
+        if args.file:
+            for diff in diffs:
+                if diff["new_path"] == args.file:
+                    file_diff = diff
+                    break
+            
+            if not file_diff:
+                print(f"File {args.file} not found in diffs")
+                return
+        else:
             # Find a file with enough added lines
             print("\nAnalyzing files for suitable changes:")
             for diff in diffs:
-                added = diff.get("added_lines", 0)
-                removed = diff.get("removed_lines", 0)
-                has_diff = bool(diff.get("diff"))
+                diff_text = diff.get("diff") or ""
+                # /diffs entries usually carry no counts; derive them from the text
+                added = diff.get("added_lines")
+                if added is None:
+                    added = count_diff_lines(diff_text, "+")
+                removed = diff.get("removed_lines")
+                if removed is None:
+                    removed = count_diff_lines(diff_text, "-")
+                has_diff = bool(diff_text)
                 print(f"  {diff['new_path']}: +{added}/-{removed} lines, has_diff={has_diff}")
                 # Try any file with a diff if we can't find one with enough additions
-                if has_diff and not target_file:
-                    target_file = diff["new_path"]
+                if has_diff and not file_diff:
+                    file_diff = diff
                 if added >= args.lines:
-                    target_file = diff["new_path"]
-                    print(f"\nSelected file: {target_file} (+{added} lines)")
+                    file_diff = diff
+                    print(f"\nSelected file: {diff['new_path']} (+{added} lines)")
                     break
+            
+            if not file_diff:
+                print("Could not find a suitable file with enough changes")
+                return
         
-        if not target_file:
-            print("Could not find a suitable file with enough changes")
-            return
-        
-        # Find the file diff
-        file_diff = None
-        for diff in diffs:
-            if diff["new_path"] == target_file:
-                file_diff = diff
-                break
-        
-        if not file_diff:
-            print(f"File {target_file} not found in diffs")
-            return
+        target_file = file_diff["new_path"]
         
         # Determine line range
         if args.start_line and args.end_line:
@@ -1,53 +1,18 @@
 #!/usr/bin/env python3
 """Test creating GitLab suggestions in inline comments."""
 
-import json
-import urllib.request
-import urllib.parse
-import urllib.error
-import ssl
+import os
 import sys
 import argparse
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def make_api_request(url: str, token: str, method: str = "GET", data: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make an API request to GitLab."""
-    headers = {
-        "Private-Token": token,
-        "Content-Type": "application/json"
-    }
-    
-    # Create SSL context that doesn't verify certificates (for self-signed certs)
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    request = urllib.request.Request(url, headers=headers, method=method)
-    
-    if data and method in ["POST", "PUT"]:
-        request.data = json.dumps(data).encode('utf-8')
-    
-    try:
-        with urllib.request.urlopen(request, context=ssl_context) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        print(f"API Error {e.code}: {error_body}")
-        raise
-
-
-def get_mr_versions(base_url: str, token: str, project_id: str, mr_iid: str) -> Dict[str, Any]:
-    """Get merge request versions to obtain SHA information."""
-    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/versions"
-    versions = make_api_request(url, token)
-    return versions[0] if versions else {}
-
-
-def get_mr_diffs(base_url: str, token: str, project_id: str, mr_iid: str) -> List[Dict[str, Any]]:
-    """Get merge request diff information."""
-    url = f"{base_url}/projects/{project_id}/merge_requests/{mr_iid}/diffs"
-    return make_api_request(url, token)
+from scripts._gitlab_api import get_mr_diffs, get_mr_versions, make_api_request
+from scripts.inline_comment import iter_added_lines
 
 
 def extract_code_context(diff_text: str, target_line: int, context_lines: int = 2) -> Tuple[List[str], int]:
@@ -146,12 +111,11 @@ def create_multi_line_suggestion(
     # Calculate the range
     lines_to_change = end_line - start_line + 1
     
-    # Construct the multi-line suggestion syntax
-    suggestion_body = f"""{comment_text}
-
-```suggestion:-{lines_to_change - 1}+{len(suggested_lines) - 1}
-{chr(10).join(suggested_lines)}
-```"""
+    # Construct the multi-line suggestion syntax in a single join
+    body_parts = [comment_text, "", f"```suggestion:-{lines_to_change - 1}+{len(suggested_lines) - 1}"]
+    body_parts.extend(suggested_lines or [""])
+    body_parts.append("```")
+    suggestion_body = "\n".join(body_parts)
     
     # Position for the inline comment (on the last line of the range)
     position = {
@@ -190,72 +154,63 @@ def main():
     print("=" * 60)
     
     try:
-        # Get MR info
+        # MR info, versions and diffs are independent, so fetch them on parallel
+        # connections instead of paying one round trip after another
         mr_url = f"{args.base_url}/projects/{args.project_id}/merge_requests/{args.mr_iid}"
-        mr_info = make_api_request(mr_url, args.token)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            mr_future = pool.submit(make_api_request, mr_url, args.token)
+            versions_future = pool.submit(get_mr_versions, args.base_url, args.token, args.project_id, args.mr_iid)
+            diffs_future = pool.submit(get_mr_diffs, args.base_url, args.token, args.project_id, args.mr_iid)
+            mr_info = mr_future.result()
+            version_info = versions_future.result()
+            diffs = diffs_future.result()
         print(f"MR Title: {mr_info['title']}")
         print(f"Author: {mr_info['author']['name']}")
         print()
         
-        # Get version info
-        print("Getting version information...")
-        version_info = get_mr_versions(args.base_url, args.token, args.project_id, args.mr_iid)
         if not version_info:
             print("Error: Could not get version information")
             return
         
-        # Get diffs
-        print("Getting diff information...")
-        diffs = get_mr_diffs(args.base_url, args.token, args.project_id, args.mr_iid)
-        
         if not diffs:
             print("No diffs found!")
             return
         
         print(f"Found {len(diffs)} changed files\n")
         
-        # Select file
-        target_file = args.file
-        if not target_file:
-            # Find a Swift or Python file with changes
-            for diff in diffs:
-                if diff.get("added_lines", 0) > 0:
-                    if diff["new_path"].endswith(('.swift', '.py', '.js', '.rb')):
-                        target_file = diff["new_path"]
-                        print(f"Selected file: {target_file}")
-                        break
-            
-            if not target_file:
-                target_file = diffs[0]["new_path"]
-                print(f"Using first file: {target_file}")
-        
-        # Find the file diff
-        file_diff = None
+        # Index the diffs by path and pick the first Swift, Python, JS or Ruby
+        # file with additions, in a single pass
+        diff_by_path = {}
+        candidate = None
         for diff in diffs:
-            if diff["new_path"] == target_file:
-                file_diff = diff
-                break
-        
-        if not file_diff:
-            print(f"File {target_file} not found in diffs")
-            return
+            diff_by_path.setdefault(diff["new_path"], diff)
+            if candidate is None and diff["new_path"].endswith(('.swift', '.py', '.js', '.rb')):
+                added = diff.get("added_lines")
+                if added is None:
+                    # /diffs entries usually carry no counts; check the text instead
+                    diff_text = diff.get("diff") or ""
+                    added = diff_text.startswith("+") or "\n+" in diff_text
+                if added:
+                    candidate = diff
         
-        # Parse the diff to find suitable lines
-        diff_lines = file_diff.get("diff", "").split('\n')
-        current_line = 0
-        added_lines = []
+        # Select file
+        if args.file:
+            target_file = args.file
+            file_diff = diff_by_path.get(target_file)
+            if not file_diff:
+                print(f"File {target_file} not found in diffs")
+                return
+        elif candidate:
+            file_diff = candidate
+            target_file = file_diff["new_path"]
+            print(f"Selected file: {target_file}")
+        else:
+            file_diff = diffs[0]
+            target_file = file_diff["new_path"]
+            print(f"Using first file: {target_file}")
         
-        for i, line in enumerate(diff_lines):
-            if line.startswith("@@"):
-                import re
-                match = re.search(r'\+(\d+)', line)
-                if match:
-                    current_line = int(match.group(1)) - 1
-            elif line.startswith("+") and not line.startswith("+++"):
-                current_line += 1
-                added_lines.append((current_line, line[1:]))  # Store line number and content
-            elif not line.startswith("-"):
-                current_line += 1
+        # Parse the diff to find suitable lines: (line number, content) pairs
+        added_lines = list(iter_added_lines(file_diff.get("diff", "")))
         
         if not added_lines:
             print("No added lines found in the file")
@@ -1,5 +1,6 @@
 """Tests for the GitLab client."""
 
+import json
 import os
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -10,6 +11,13 @@ from httpx import Response
 from mcp_extended_gitlab.client import GitLabClient, GitLabConfig
 
 
+def sent_json(kwargs):
+    """Decode the JSON body passed to httpx, whether as json= or pre-encoded content=."""
+    if 'content' in kwargs:
+        return json.loads(kwargs['content'])
+    return kwargs.get('json')
+
+
 class TestGitLabConfig:
     """Test GitLab configuration."""
     
@@ -82,6 +90,20 @@ class TestGitLabClient:
         assert headers["PRIVATE-TOKEN"] == "test-token"
         assert "application/json" in headers["Accept"]
     
+    def test_client_connection_limits(self):
+        """Test that pool limits from the config reach the transport."""
+        config = GitLabConfig(
+            base_url="https://gitlab.example.com/api/v4",
+            private_token="test-token",
+            max_keepalive_connections=8,
+            keepalive_expiry=15.0
+        )
+        pool = GitLabClient(config).client._transport._pool
+        
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 8
+        assert pool._keepalive_expiry == 15.0
+    
     @pytest.mark.asyncio
     async def test_get_request(self, client, mock_response):
         """Test GET request."""
@@ -110,6 +132,17 @@ class TestGitLabClient:
             
             assert kwargs.get('params') == params
     
+    @pytest.mark.asyncio
+    async def test_empty_params_not_forwarded(self, client, mock_response):
+        """Test that empty parameter dicts are sent as no params at all."""
+        with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+            
+            await client.get("/projects", params={})
+            
+            args, kwargs = mock_get.call_args
+            assert kwargs.get('params') is None
+    
     @pytest.mark.asyncio
     async def test_post_request(self, client, mock_response):
         """Test POST request."""
@@ -123,7 +156,7 @@ class TestGitLabClient:
             args, kwargs = mock_post.call_args
             
             assert args[0] == "https://gitlab.example.com/api/v4/projects"
-            assert kwargs.get('json') == data
+            assert sent_json(kwargs) == data
             assert result == {"id": 1, "name": "test"}
     
     @pytest.mark.asyncio
@@ -139,7 +172,7 @@ class TestGitLabClient:
             args, kwargs = mock_put.call_args
             
             assert args[0] == "https://gitlab.example.com/api/v4/projects/1"
-            assert kwargs.get('json') == data
+            assert sent_json(kwargs) == data
     
     @pytest.mark.asyncio
     async def test_delete_request(self, client, mock_response):
@@ -225,6 +258,75 @@ class TestGitLabClient:
             
             # Could extend client to return pagination info if needed
 
+    
+    @pytest.mark.asyncio
+    async def test_get_all_pages(self, client):
+        """Test fetching every page of a paginated endpoint."""
+        def page_response(page, headers):
+            response = Mock(spec=Response)
+            response.status_code = 200
+            response.headers = {"content-type": "application/json", **headers}
+            response.json = Mock(return_value=[{"id": page}])
+            response.raise_for_status = Mock()
+            return response
+        
+        async def fake_get(url, params=None):
+            return page_response(params["page"], {"x-total-pages": "3"})
+        
+        with patch.object(client.client, 'get', side_effect=fake_get) as mock_get:
+            result = await client.get_all_pages("/projects/1/jobs", params={"scope": ["failed"]})
+            
+            assert result == {
+                "items": [{"id": 1}, {"id": 2}, {"id": 3}],
+                "count": 3,
+                "total_pages": 3,
+                "truncated": False,
+                "next_page": None
+            }
+            assert mock_get.call_count == 3
+            for call in mock_get.call_args_list:
+                assert call.kwargs["params"]["per_page"] == 100
+                assert call.kwargs["params"]["scope"] == ["failed"]
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_stops_at_max_pages(self, client):
+        """Test that both pagination modes stop after max_pages pages."""
+        def page_response(body, headers):
+            response = Mock(spec=Response)
+            response.status_code = 200
+            response.headers = {"content-type": "application/json", **headers}
+            response.json = Mock(return_value=body)
+            response.raise_for_status = Mock()
+            return response
+
+        async def total_pages_get(url, params=None):
+            return page_response([{"id": params["page"]}], {"x-total-pages": "1000"})
+
+        with patch.object(client.client, 'get', side_effect=total_pages_get) as mock_get:
+            result = await client.get_all_pages("/projects/1/jobs", max_pages=3)
+
+            assert result["items"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+            assert result["total_pages"] == 1000
+            assert result["truncated"] is True
+            assert result["next_page"] == 4
+            assert mock_get.call_count == 3
+
+        async def next_page_get(url, params=None):
+            # A non-list body is kept as one item instead of being split into its keys
+            return page_response({"id": params["page"]}, {"x-next-page": str(params["page"] + 1)})
+
+        with patch.object(client.client, 'get', side_effect=next_page_get) as mock_get:
+            result = await client.get_all_pages("/bulk_imports", max_pages=2)
+
+            assert result["items"] == [{"id": 1}, {"id": 2}]
+            assert result["total_pages"] is None
+            assert result["truncated"] is True
+            assert result["next_page"] == 3
+            assert mock_get.call_count == 2
+
+        with pytest.raises(ValueError):
+            await client.get_all_pages("/bulk_imports", max_pages=0)
+
 
 class TestClientIntegration:
     """Integration tests for client with real-like scenarios."""
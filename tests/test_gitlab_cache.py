@@ -0,0 +1,44 @@
+"""Tests for the on-disk MR cache in scripts/_gitlab_cache.py."""
+
+import os
+
+import pytest
+
+from scripts import _gitlab_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setattr(_gitlab_cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestCache:
+    """Test the disk cache used by the inline comment scripts."""
+
+    def test_cached_call_fetches_once_per_validator(self, cache_dir):
+        """Test that a response is served from disk until the validator changes."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert _gitlab_cache.cached_call(fetch, "http://gitlab/x", "v1") == {"n": 1}
+        assert _gitlab_cache.cached_call(fetch, "http://gitlab/x", "v1") == {"n": 1}
+        assert _gitlab_cache.cached_call(fetch, "http://gitlab/x", "v2") == {"n": 2}
+        assert _gitlab_cache.cached_call(fetch, "http://gitlab/x", None) == {"n": 3}
+        assert len(os.listdir(cache_dir)) == 2
+
+    def test_failed_store_leaves_no_temp_file(self, cache_dir, monkeypatch):
+        """Test that unserializable data and a failed rename are swallowed and cleaned up."""
+        _gitlab_cache.store("http://gitlab/x", "v1", {"bad": object()})
+        assert os.listdir(cache_dir) == []
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(_gitlab_cache.os, "replace", fail_replace)
+        _gitlab_cache.store("http://gitlab/x", "v1", {"ok": True})
+        assert os.listdir(cache_dir) == []
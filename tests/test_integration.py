@@ -7,7 +7,7 @@ import pytest
 from fastmcp import FastMCP
 
 from mcp_extended_gitlab.server import mcp
-from mcp_extended_gitlab.client import GitLabClient
+from mcp_extended_gitlab.client import MAX_CONCURRENT_REQUESTS, GitLabClient
 
 
 class TestServerIntegration:
@@ -273,6 +273,150 @@ class TestErrorScenarios:
             assert "404 Project Not Found" in str(exc_info.value)
 
 
+class TestResponseCache:
+    """Test caching of idempotent read tools."""
+    
+    @pytest.mark.asyncio
+    async def test_cached_get_serves_repeated_reads(self, mock_gitlab_client):
+        """Test that repeated reads hit the cache and writes invalidate it."""
+        from mcp_extended_gitlab import server
+        
+        server.clear_cache()
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.get = AsyncMock(return_value={"version": "17.0.0"})
+            mock_gitlab_client.post = AsyncMock(return_value={"id": 1})
+            
+            first = await mcp._tools['get_version'].func()
+            first["version"] = "mutated"
+            second = await mcp._tools['get_version'].func()
+            
+            assert second == {"version": "17.0.0"}
+            assert mock_gitlab_client.get.call_count == 1
+            
+            await mcp._tools['get_broadcast_message'].func(message_id="1")
+            await mcp._tools['create_broadcast_message'].func(message="Hello")
+            await mcp._tools['get_broadcast_message'].func(message_id="1")
+            
+            assert mock_gitlab_client.get.call_count == 3
+        server.clear_cache()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_reads_made_during_it(self, mock_gitlab_client):
+        """Test that a read racing a write does not leave a stale cache entry."""
+        from mcp_extended_gitlab import server
+
+        server.clear_cache()
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.get = AsyncMock(return_value={"message": "old"})
+
+            async def post_with_concurrent_read(*args, **kwargs):
+                await mcp._tools['list_broadcast_messages'].func()
+                return {"id": 1}
+
+            mock_gitlab_client.post = AsyncMock(side_effect=post_with_concurrent_read)
+
+            await mcp._tools['create_broadcast_message'].func(message="new")
+            await mcp._tools['list_broadcast_messages'].func()
+
+            assert mock_gitlab_client.get.call_count == 2
+        server.clear_cache()
+
+
+class TestPathEncoding:
+    """Test encoding of user-supplied path segments."""
+    
+    @pytest.mark.asyncio
+    async def test_branch_name_is_url_encoded(self, mock_gitlab_client):
+        """Test that branch names with slashes are encoded exactly once."""
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.get = AsyncMock(return_value={"name": "feature/login"})
+            mock_gitlab_client.delete = AsyncMock(return_value={})
+            
+            await mcp._tools['get_repository_branch'].func(project_id="1", branch_name="feature/login")
+            await mcp._tools['delete_repository_branch'].func(project_id="1", branch_name="feature/login")
+            
+            mock_gitlab_client.get.assert_called_with("/projects/1/repository/branches/feature%2Flogin")
+            mock_gitlab_client.delete.assert_called_with("/projects/1/repository/branches/feature%2Flogin")
+            
+            # A literal % is part of the name, not an escape
+            await mcp._tools['get_repository_branch'].func(project_id="1", branch_name="fix-100%25")
+            
+            mock_gitlab_client.get.assert_called_with("/projects/1/repository/branches/fix-100%2525")
+
+
+class TestBatchTool:
+    """Test the concurrent batch tool."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order_and_isolates_errors(self, mock_gitlab_client):
+        """Test that batch results keep request order and report per-call errors."""
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.get = AsyncMock(side_effect=lambda url, params=None: {"url": url})
+            
+            result = await mcp._tools['call_many'].func(calls=[
+                {"tool": "get_project_job", "args": {"project_id": "1", "job_id": "10"}},
+                {"tool": "no_such_tool", "args": {}},
+                {"tool": "get_project_job", "args": {"project_id": "1", "job_id": "11"}},
+            ])
+            
+            assert result["count"] == 3
+            assert result["results"][0] == {"url": "/projects/1/jobs/10"}
+            assert "Unknown tool" in result["results"][1]["error"]
+            assert result["results"][2] == {"url": "/projects/1/jobs/11"}
+
+    @pytest.mark.asyncio
+    async def test_batch_bounds_calls(self, mock_gitlab_client):
+        """Test that batch calls run at most 8 at a time and oversized batches are rejected."""
+        in_flight = 0
+        peak = 0
+
+        async def get(url, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"url": url}
+
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.get = AsyncMock(side_effect=get)
+            call = {"tool": "get_project_job", "args": {"project_id": "1", "job_id": "10"}}
+
+            result = await mcp._tools['call_many'].func(calls=[call] * 20)
+            assert result["count"] == 20
+            assert peak == MAX_CONCURRENT_REQUESTS
+
+            with pytest.raises(ValueError):
+                await mcp._tools['call_many'].func(calls=[call] * 101)
+
+    @pytest.mark.asyncio
+    async def test_bulk_mark_migrations_as_successful(self, mock_gitlab_client):
+        """Test that migrations are marked concurrently with per-timestamp results."""
+        async def post(url, json_data=None):
+            if "bad" in url:
+                raise Exception("404 Not Found")
+            return {"url": url}
+        
+        with patch('mcp_extended_gitlab.server.get_gitlab_client') as mock_get_client:
+            mock_get_client.return_value = mock_gitlab_client
+            mock_gitlab_client.post = AsyncMock(side_effect=post)
+            
+            result = await mcp._tools['bulk_mark_migrations_as_successful'].func(
+                timestamps=["20240101000000", "bad", "20240102000000"]
+            )
+            
+            assert result["count"] == 3
+            assert result["results"][0] == {"timestamp": "20240101000000", "url": "/admin/migrations/20240101000000/mark"}
+            assert result["results"][1]["timestamp"] == "bad"
+            assert "404" in result["results"][1]["error"]
+            assert result["results"][2]["url"] == "/admin/migrations/20240102000000/mark"
+
+
 class TestRealWorldScenarios:
     """Test real-world usage scenarios."""
     
@@ -0,0 +1,48 @@
+"""Tests for the batch path of scripts/test_multiline_comment.py."""
+
+import asyncio
+
+import pytest
+
+from scripts import test_multiline_comment as multiline
+
+
+def _target(n):
+    """A create_many target whose start line identifies it."""
+    return {"project_id": "1", "mr_iid": "2", "file_path": "a.py", "start_line": n, "end_line": n + 1,
+            "comment_text": f"comment {n}", "version_info": {}}
+
+
+class TestCreateMany:
+    """Test creating multi-line comments concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_bounds_concurrency_and_keeps_order(self, monkeypatch):
+        """Test that at most `concurrency` comments are in flight and results follow target order."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(client, base_url, target):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later targets finish first, so completion order differs from target order
+            await asyncio.sleep(0.001 * (20 - target["start_line"]))
+            in_flight -= 1
+            if target["start_line"] == 5:
+                raise RuntimeError("boom")
+            return {"id": target["start_line"]}
+
+        monkeypatch.setattr(multiline, "create_multiline_comment_async", fake_create)
+
+        results = await multiline.create_many("http://gitlab", "token", [_target(n) for n in range(20)], concurrency=3)
+
+        assert peak == 3
+        assert [r["id"] for i, r in enumerate(results) if i != 5] == [n for n in range(20) if n != 5]
+        assert isinstance(results[5], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_zero_concurrency(self):
+        """Test that a concurrency below one is refused instead of hanging."""
+        with pytest.raises(ValueError):
+            await multiline.create_many("http://gitlab", "token", [_target(1)], concurrency=0)
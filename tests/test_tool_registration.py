@@ -181,6 +181,37 @@ class TestToolRegistration:
             
             assert not duplicates, f"Duplicate tool names found: {set(duplicates)}"
     
+    def test_module_tools_match_registered_tools(self):
+        """Test that the registry reports the tools a module actually registers."""
+        from mcp_extended_gitlab.api.core import projects
+        from mcp_extended_gitlab.tool_registry import get_module_tools
+        
+        test_mcp = FastMCP("test")
+        projects.register(test_mcp)
+        
+        assert set(get_module_tools(projects)) == set(test_mcp._tools.keys())
+    
+    def test_registry_lookups_are_read_only(self):
+        """Test that cached registry results cannot be mutated by callers."""
+        from mcp_extended_gitlab.tool_registry import get_all_tools, get_tools_by_category
+        
+        all_tools = get_all_tools()
+        by_category = get_tools_by_category()
+        
+        assert isinstance(all_tools, tuple)
+        assert list(all_tools) == sorted(all_tools)
+        assert "list_projects" in by_category["core"]
+        with pytest.raises(TypeError):
+            by_category["core"] = ()
+    
+    def test_enabled_modules_for_tools(self):
+        """Test that enabled tools resolve to the modules defining them."""
+        from mcp_extended_gitlab.tool_registry import get_enabled_modules
+        
+        modules = get_enabled_modules(["list_projects", "get_lint_result", "no_such_tool"])
+        
+        assert modules == {"projects", "lint"}
+    
     def test_tool_count_matches_readme(self):
         """Test that the actual tool count matches what's stated in README."""
         from mcp_extended_gitlab.server import mcp
@@ -0,0 +1,49 @@
+"""Tests for the tool tester in scripts/test_all_tools.py."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from scripts.test_all_tools import ToolTester
+
+
+def _fake_tool(function):
+    """Tool info as produced by ToolTester.get_all_tools, for a parameterless tool."""
+    return {"module": "fake", "category": "core", "function": function, "parameters": {}}
+
+
+class TestWriteProtection:
+    """Test that the tester leaves mutating tools alone unless asked."""
+
+    def test_discovered_tools_default_to_read_only(self, mock_gitlab_config, monkeypatch):
+        """Test that only get_/list_/search_ tools get parameters by default."""
+        monkeypatch.setenv("GITLAB_TEST_PROJECT_ID", "123")
+        tester = ToolTester(mock_gitlab_config)
+
+        for name, info in tester.get_all_tools().items():
+            params, skip_reason = tester._get_test_params(name, info["parameters"])
+            if not skip_reason:
+                assert name.startswith(("get_", "list_", "search_")), name
+
+        for name in ["delete_project", "transfer_project", "archive_project", "call_many"]:
+            _, skip_reason = tester._get_test_params(name, tester.get_tool(name)["parameters"])
+            assert "--allow-writes" in skip_reason
+
+    @pytest.mark.asyncio
+    async def test_mutating_tools_need_allow_writes(self, mock_gitlab_config):
+        """Test that mutating tools are only called with allow_writes."""
+        for allow_writes in (False, True):
+            tester = ToolTester(mock_gitlab_config, allow_writes=allow_writes)
+            delete_project = AsyncMock(return_value={})
+            list_projects = AsyncMock(return_value=[])
+            tester._tools = {
+                "delete_project": _fake_tool(delete_project),
+                "list_projects": _fake_tool(list_projects),
+            }
+
+            summary = await tester.test_tools()
+            await tester.client.close()
+
+            assert list_projects.call_count == 1
+            assert delete_project.call_count == (1 if allow_writes else 0)
+            assert summary.skipped == (0 if allow_writes else 1)